@@ -3,8 +3,24 @@ from __future__ import annotations
 import argparse
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from cze_wp_scraper.scraper.scraper import MatchScraper
+from cze_wp_scraper.scraper.cache import MatchPageCache
+from cze_wp_scraper.utils.export import DEFAULT_OUTPUT_FORMAT, WRITERS, infer_output_format, write_dataframe
+
+if TYPE_CHECKING:
+    from cze_wp_scraper.utils.export import OutputFormat
+
+
+def _resolve_output_format(output: str | None, output_format: OutputFormat | None) -> OutputFormat | None:
+    """Return the explicit output format, or infer it from the output path, exiting if the extension is unknown."""
+    if output is None or output_format is not None:
+        return output_format
+    try:
+        return infer_output_format(output)
+    except ValueError as e:
+        print(f"Error: {e}. Use --format to choose one.", file=sys.stderr)
+        sys.exit(1)
 
 
 def main() -> None:
@@ -21,7 +37,38 @@ def main() -> None:
         "-o",
         "--output",
         type=str,
-        help="Output CSV file path (optional). If not provided, prints to stdout.",
+        help="Output file path (optional). If not provided, prints to stdout.",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=sorted(WRITERS),
+        help=(
+            "Output file format. Inferred from the output file extension if not provided, "
+            f"or {DEFAULT_OUTPUT_FORMAT} if it has none."
+        ),
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=MatchPageCache.DEFAULT_CACHE_DIR,
+        help=f"Directory for caching finished match pages (default: {MatchPageCache.DEFAULT_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the page cache: always download and never store pages.",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Re-download all pages, overwriting cached copies, and re-check game IDs previously found missing.",
+    )
+    parser.add_argument(
+        "-c",
+        "--concurrency",
+        type=int,
+        help="Maximum number of requests in flight at once (default: the HTTP connection pool size)",
     )
 
     args = parser.parse_args()
@@ -30,6 +77,22 @@ def main() -> None:
         print("Error: max_game_id must be at least 1", file=sys.stderr)
         sys.exit(1)
 
+    # Resolved before scraping, so an unknown output extension fails fast instead of after the whole run
+    output_format = _resolve_output_format(args.output, args.format)
+
+    # Imported only once the arguments are valid, so --help and usage errors do not pay for loading pandas
+    from cze_wp_scraper.scraper.scraper import MatchScraper
+
+    try:
+        scraper = MatchScraper(
+            cache_dir=None if args.no_cache else args.cache_dir,
+            refresh_cache=args.refresh,
+            concurrency=args.concurrency,
+        )
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
     print("=" * 80)
     print("Czech Water Polo Scraper - Batch Scraping")
     print("=" * 80)
@@ -41,7 +104,6 @@ def main() -> None:
     game_ids = list(range(1, args.max_game_id + 1))
 
     # Scrape matches
-    scraper = MatchScraper()
     df = scraper.scrape_matches(game_ids)
 
     # Display results
@@ -60,7 +122,7 @@ def main() -> None:
         # Save to file if output path provided
         if args.output:
             output_path = Path(args.output)
-            df.to_csv(output_path, index=False)
+            write_dataframe(df, output_path, output_format)
             print(f"Results saved to: {output_path}")
         else:
             print("Full results:")
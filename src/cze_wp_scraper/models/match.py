@@ -8,6 +8,29 @@ from pydantic import BaseModel, field_validator
 from cze_wp_scraper.utils.constants import Constants
 
 
+def _parse_output_date(value: str) -> datetime:
+    """Parse a date in Constants.OUTPUT_DATE_FORMAT.
+
+    The zero-padded "DD.MM.YYYY HH:MM:SS" shape is read by slicing, skipping strptime's
+    format interpreter; anything else, including out-of-range fields, goes through strptime,
+    which also raises the errors.
+    """
+    digits = value[0:2] + value[3:5] + value[6:10] + value[11:13] + value[14:16] + value[17:19]
+    if len(value) == 19 and value[2:6:3] == ".." and value[10:17:3] == " ::" and digits.isascii() and digits.isdigit():
+        try:
+            return datetime(
+                int(value[6:10]),
+                int(value[3:5]),
+                int(value[0:2]),
+                int(value[11:13]),
+                int(value[14:16]),
+                int(value[17:19]),
+            )
+        except ValueError:
+            pass
+    return datetime.strptime(value, Constants.OUTPUT_DATE_FORMAT)
+
+
 class MatchModel(BaseModel):
     """Pydantic model for a match info data."""
 
@@ -24,5 +47,5 @@ class MatchModel(BaseModel):
     def validate_match_date(cls, v: str | datetime) -> datetime:
         """Validate match date."""
         if isinstance(v, str):
-            return datetime.strptime(v, Constants.OUTPUT_DATE_FORMAT)
+            return _parse_output_date(v)
         return v
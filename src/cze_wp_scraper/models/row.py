@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+
+@dataclass(slots=True, frozen=True)
+class MatchRow:
+    """Parsed match row.
+
+    Lightweight counterpart of MatchModel used on the scraping hot path, where every
+    field is already produced with the right type by the parser and per-row Pydantic
+    validation would only add overhead. The winner is left unset by the parser and
+    computed for all rows at once when the DataFrame is built. It lives apart from
+    MatchModel so the scraping path does not import Pydantic.
+    """
+
+    game_id: int
+    home_team: str
+    away_team: str
+    match_date: datetime
+    league: str
+    home_score: int
+    away_score: int
+    winner: Literal["H", "A", "D"] | None = None
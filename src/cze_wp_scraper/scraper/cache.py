@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import ClassVar
+
+from loguru import logger
+
+
+class MatchPageCache:
+    """Filesystem cache of match page HTML keyed by game ID.
+
+    Alongside the pages it keeps a negative cache of game IDs that are known to be
+    missing or unparseable, so re-runs do not fetch them again.
+    """
+
+    DEFAULT_CACHE_DIR: ClassVar[str] = ".cache/csvp"
+    BAD_IDS_FILENAME: ClassVar[str] = "bad_ids.json"
+
+    def __init__(self, cache_dir: str | Path = DEFAULT_CACHE_DIR, refresh: bool = False):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory where match pages are stored.
+            refresh: If True, cached pages and known bad game IDs are ignored on read but still overwritten on write.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.refresh = refresh
+        self._bad_ids = set() if refresh else self._load_bad_ids()
+        self._bad_ids_dirty = False
+
+    def _page_path(self, game_id: int) -> Path:
+        """Get the path of the cached page for a game ID."""
+        return self.cache_dir / f"{game_id}.html"
+
+    def _bad_ids_path(self) -> Path:
+        """Get the path of the known bad game IDs file."""
+        return self.cache_dir / self.BAD_IDS_FILENAME
+
+    def _load_bad_ids(self) -> set[int]:
+        """Load known bad game IDs from disk."""
+        try:
+            return set(json.loads(self._bad_ids_path().read_text(encoding="utf-8")))
+        except FileNotFoundError:
+            return set()
+
+    def get(self, game_id: int) -> bytes | None:
+        """Get the cached HTML for a game ID.
+
+        Args:
+            game_id: Game ID to look up.
+
+        Returns:
+            Raw cached HTML, or None if the page is not cached or refresh is enabled.
+        """
+        if self.refresh:
+            return None
+        try:
+            return self._page_path(game_id).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def set(self, game_id: int, html: bytes) -> None:
+        """Store the HTML for a game ID.
+
+        Args:
+            game_id: Game ID the page belongs to.
+            html: Raw HTML to store.
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._page_path(game_id)
+        # Write to a temporary file first so an interrupted run never leaves a truncated page behind
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(html)
+        tmp_path.replace(path)
+        logger.debug(f"Cached match {game_id} at {path}")
+
+    def is_bad(self, game_id: int) -> bool:
+        """Check whether a game ID is known to be missing or unparseable.
+
+        Args:
+            game_id: Game ID to check.
+
+        Returns:
+            True if the game ID was marked bad, either in this run or a previous one.
+        """
+        return game_id in self._bad_ids
+
+    def mark_bad(self, game_id: int) -> None:
+        """Mark a game ID as missing or unparseable.
+
+        The mark is kept in memory until save_bad_ids is called.
+
+        Args:
+            game_id: Game ID to mark.
+        """
+        if game_id not in self._bad_ids:
+            self._bad_ids.add(game_id)
+            self._bad_ids_dirty = True
+
+    def save_bad_ids(self) -> None:
+        """Persist known bad game IDs if any were marked since the cache was created."""
+        if not self._bad_ids_dirty:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._bad_ids_path()
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(sorted(self._bad_ids)), encoding="utf-8")
+        tmp_path.replace(path)
+        self._bad_ids_dirty = False
+        logger.debug(f"Saved {len(self._bad_ids)} known bad game IDs to {path}")
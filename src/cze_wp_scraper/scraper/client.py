@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-from typing import ClassVar
+import asyncio
+from typing import TYPE_CHECKING, ClassVar
 
 import httpx
 from loguru import logger
 
+if TYPE_CHECKING:
+    import ssl
+
 
 class HTTPMatchClient:
     """HTTP client for fetching match pages from csvp.cz."""
@@ -16,6 +20,16 @@ class HTTPMatchClient:
         "AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/120.0.0.0 Safari/537.36"
     )
+    MAX_CONNECTIONS: ClassVar[int] = 64
+    KEEPALIVE_EXPIRY: ClassVar[float] = 60.0
+    # Retries of failed connection attempts, handled by the transport
+    CONNECT_RETRIES: ClassVar[int] = 3
+    # Retries of responses with a retryable status code, handled by fetch_match_async
+    MAX_RETRIES: ClassVar[int] = 3
+    RETRY_BACKOFF: ClassVar[float] = 0.5
+    RETRY_STATUS_CODES: ClassVar[frozenset[int]] = frozenset({429, 500, 502, 503, 504})
+
+    _ssl_context: ClassVar[ssl.SSLContext | None] = None
 
     def __init__(
         self,
@@ -34,13 +48,42 @@ class HTTPMatchClient:
         self.timeout = timeout
         self.user_agent = user_agent
         self._client: httpx.Client | None = None
+        self._async_client: httpx.AsyncClient | None = None
+
+    @classmethod
+    def _get_ssl_context(cls) -> ssl.SSLContext:
+        """Get the SSL context shared by all clients, creating it on first use.
+
+        Loading the CA bundle is the expensive part of building a client, so it is done once per process.
+        """
+        if cls._ssl_context is None:
+            cls._ssl_context = httpx.create_ssl_context()
+        return cls._ssl_context
+
+    def _get_httpx_kwargs(self) -> dict:
+        """Get keyword arguments shared by the sync and async httpx clients."""
+        return {
+            "timeout": self.timeout,
+            "headers": {"User-Agent": self.user_agent},
+        }
+
+    def _get_transport_kwargs(self) -> dict:
+        """Get keyword arguments shared by the sync and async httpx transports."""
+        return {
+            "verify": self._get_ssl_context(),
+            "http2": True,
+            "limits": httpx.Limits(
+                max_connections=self.MAX_CONNECTIONS,
+                max_keepalive_connections=self.MAX_CONNECTIONS,
+                keepalive_expiry=self.KEEPALIVE_EXPIRY,
+            ),
+            "retries": self.CONNECT_RETRIES,
+        }
 
     def __enter__(self):
         """Context manager entry."""
-        self._client = httpx.Client(
-            timeout=self.timeout,
-            headers={"User-Agent": self.user_agent},
-        )
+        transport = httpx.HTTPTransport(**self._get_transport_kwargs())
+        self._client = httpx.Client(transport=transport, **self._get_httpx_kwargs())
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -49,29 +92,80 @@ class HTTPMatchClient:
             self._client.close()
             self._client = None
 
-    def fetch_match(self, match_id: int) -> str:
+    async def __aenter__(self):
+        """Async context manager entry."""
+        transport = httpx.AsyncHTTPTransport(**self._get_transport_kwargs())
+        self._async_client = httpx.AsyncClient(transport=transport, **self._get_httpx_kwargs())
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        if self._async_client:
+            await self._async_client.aclose()
+            self._async_client = None
+
+    def _match_url(self, match_id: int) -> str:
+        """Build the match page URL, validating the match ID."""
+        if match_id <= 0:
+            logger.error(f"match_id must be positive, got {match_id}")
+            raise ValueError(f"match_id must be positive, got {match_id}")
+        return f"{self.base_url}/zapas/{match_id}"
+
+    def fetch_match(self, match_id: int) -> bytes:
         """Fetch HTML content for a match.
 
         Args:
             match_id: Match ID from URL
 
         Returns:
-            HTML content as string
+            Raw HTML content, left undecoded for the parser
 
         Raises:
             httpx.HTTPError: If HTTP request fails
             httpx.TimeoutException: If request times out
             ValueError: If match_id is invalid
         """
-        if match_id <= 0:
-            logger.error(f"match_id must be positive, got {match_id}")
-            raise ValueError(f"match_id must be positive, got {match_id}")
+        url = self._match_url(match_id)
 
         if not self._client:
             logger.error("MatchClient must be used as context manager")
             raise RuntimeError("MatchClient must be used as context manager")
 
-        url = f"{self.base_url}/zapas/{match_id}"
         response = self._client.get(url)
         response.raise_for_status()
-        return response.text
+        return response.content
+
+    async def fetch_match_async(self, match_id: int) -> bytes:
+        """Fetch HTML content for a match using the async client.
+
+        Responses with a retryable status code (429 or 5xx) are retried with
+        exponential backoff before the error is raised. Failed connection attempts
+        are retried separately by the transport.
+
+        Args:
+            match_id: Match ID from URL
+
+        Returns:
+            Raw HTML content, left undecoded for the parser
+
+        Raises:
+            httpx.HTTPError: If HTTP request fails
+            httpx.TimeoutException: If request times out
+            ValueError: If match_id is invalid
+        """
+        url = self._match_url(match_id)
+
+        if not self._async_client:
+            logger.error("MatchClient must be used as async context manager")
+            raise RuntimeError("MatchClient must be used as async context manager")
+
+        for attempt in range(self.MAX_RETRIES + 1):
+            response = await self._async_client.get(url)
+            if response.status_code not in self.RETRY_STATUS_CODES or attempt == self.MAX_RETRIES:
+                break
+            delay = self.RETRY_BACKOFF * 2**attempt
+            logger.warning(f"Got {response.status_code} for match {match_id}, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+        response.raise_for_status()
+        return response.content
@@ -1,15 +1,22 @@
 from __future__ import annotations
 
+import re
+import threading
 from datetime import datetime
-from typing import ClassVar
+from html import unescape
+from itertools import islice
+from typing import TYPE_CHECKING, ClassVar
 
-from bs4 import BeautifulSoup
 from loguru import logger
+from lxml import etree
+from lxml import html as lxml_html
 
-from cze_wp_scraper.models.match import MatchModel
-from cze_wp_scraper.utils.constants import Constants
+from cze_wp_scraper.models.row import MatchRow
 from cze_wp_scraper.utils.exceptions import MatchParsingError
 
+if TYPE_CHECKING:
+    from lxml.html import HtmlElement
+
 
 class MatchInfoParser:
     """Parser for parsing match data from HTML."""
@@ -20,105 +27,239 @@ class MatchInfoParser:
     SCORE_DIV_CLASS: ClassVar[str] = "col-12 col-md-12 col-lg-12 col-xl-2 score mb-4"
 
     QUARTER_HEADER_TEXT: ClassVar[str] = "čtvrtina"
-    INPUT_DATE_FORMAT: ClassVar[str] = "%d. %m. %Y - %H:%M"
+    # Section headers that follow the team headers inside div.whole
+    NON_TEAM_HEADERS: ClassVar[frozenset[str]] = frozenset({"Průběh utkání", "sociální sítě", "Partneři"})
+    # Header text is "<%d. %m. %Y - %H:%M>, <league>", matched directly instead of splitting and going through strptime
+    DATE_LEAGUE_RE: ClassVar[re.Pattern[str]] = re.compile(
+        r"\s*(?P<day>\d{1,2})\.\s*(?P<month>\d{1,2})\.\s*(?P<year>\d{4})\s*-\s*(?P<hour>\d{1,2}):(?P<minute>\d{2})"
+        r"\s*,\s*(?P<league>[^,\n]*)"
+    )
+    SCORE_RE: ClassVar[re.Pattern[str]] = re.compile(r"\s*(?P<home>\d+)\s*:\s*(?P<away>\d+)")
     MATCH_FINISHED_TEXT: ClassVar[str] = "Ukončené utkání"
+    ENCODING: ClassVar[str] = "utf-8"
+
+    # Fast path: patterns matched directly against the raw bytes of well-formed pages.
+    _RE_DATE_LEAGUE: ClassVar[re.Pattern[bytes]] = re.compile(
+        rf'class="{re.escape(DATE_LEAGUE_DIV_CLASS)}".*?class="{re.escape(DATE_LEAGUE_TEXT_CLASS)}"[^>]*>([^<]*)<'.encode(),
+        re.DOTALL,
+    )
+    _RE_TEAM_HEADER: ClassVar[re.Pattern[bytes]] = re.compile(rb"<h3[^>]*>(.*?)</h3>", re.DOTALL)
+    _RE_SCORE: ClassVar[re.Pattern[bytes]] = re.compile(
+        rf'class="{re.escape(SCORE_DIV_CLASS)}"[^>]*>\s*(\d+)\s*:\s*(\d+)\s*<.*?class="state"[^>]*>([^<]*)<'.encode(),
+        re.DOTALL,
+    )
+    _DATE_LEAGUE_DIV_MARKER: ClassVar[bytes] = f'class="{DATE_LEAGUE_DIV_CLASS}"'.encode()
+    _TEAM_HEADERS_MARKER: ClassVar[bytes] = f'class="{TEAM_HEADERS_CLASS}"'.encode()
+    _SCORE_DIV_MARKER: ClassVar[bytes] = f'class="{SCORE_DIV_CLASS}"'.encode()
+    _MATCH_FINISHED_BYTES: ClassVar[bytes] = MATCH_FINISHED_TEXT.encode(ENCODING)
+
+    _NODE_CLASSES: ClassVar[frozenset[str]] = frozenset({DATE_LEAGUE_DIV_CLASS, TEAM_HEADERS_CLASS, SCORE_DIV_CLASS})
+
+    # lxml parsers must not be shared between threads, so each thread gets its own on first use
+    _parser_local: ClassVar[threading.local] = threading.local()
+
+    @classmethod
+    def _collect_nodes(cls, root: HtmlElement) -> dict[str, HtmlElement]:
+        """Map each of _NODE_CLASSES to its first div, stopping the walk once all of them are found."""
+        nodes: dict[str, HtmlElement] = {}
+        for div in root.iter("div"):
+            div_class = div.get("class")
+            if div_class in cls._NODE_CLASSES:
+                nodes.setdefault(div_class, div)
+                if len(nodes) == len(cls._NODE_CLASSES):
+                    break
+        return nodes
 
     @classmethod
-    def _extract_league_and_date(cls, soup: BeautifulSoup) -> tuple[str, str]:
-        """Extract league and date from HTML."""
+    def _find_nodes(cls, root: HtmlElement) -> tuple[HtmlElement, HtmlElement, HtmlElement]:
+        """Find the date/league, team headers and score divs in a single walk over the tree.
+
+        Raises:
+            MatchParsingError: If any of the divs is missing.
+        """
+        nodes = cls._collect_nodes(root)
+
+        outer_div = nodes.get(cls.DATE_LEAGUE_DIV_CLASS)
+        date_league_div = (
+            None if outer_div is None else outer_div.find(f'.//div[@class="{cls.DATE_LEAGUE_TEXT_CLASS}"]')
+        )
+        whole_div = nodes.get(cls.TEAM_HEADERS_CLASS)
+        score_div = nodes.get(cls.SCORE_DIV_CLASS)
+        for name, node in (("league and date", date_league_div), ("teams", whole_div), ("score", score_div)):
+            if node is None:
+                logger.error(f"Failed to extract {name}")
+                raise MatchParsingError(f"Failed to extract {name}")
+        return date_league_div, whole_div, score_div
+
+    @classmethod
+    def _extract_league_and_date(cls, date_league_div: HtmlElement) -> tuple[str, datetime]:
+        """Extract league and date from the date/league div."""
         try:
-            date_league_div = soup.find("div", class_=cls.DATE_LEAGUE_DIV_CLASS)
-            if not date_league_div:
-                raise MatchParsingError("Failed to extract league and date")
-            date_league_div = date_league_div.find("div", class_=cls.DATE_LEAGUE_TEXT_CLASS)
-            if not date_league_div:
-                raise MatchParsingError("Failed to extract league and date")
-            date_league_text = date_league_div.get_text(strip=False)
-            date_league_text = date_league_text.split("\n")[1].strip()
-
-            res = date_league_text.split(",")
-            league = res[1].strip()
-            match_date_str = res[0].strip()
-
-            return league, datetime.strptime(match_date_str, cls.INPUT_DATE_FORMAT).strftime(
-                Constants.OUTPUT_DATE_FORMAT
-            )
-        except (AttributeError, ValueError) as e:
+            return cls._split_league_and_date(date_league_div.text_content())
+        except ValueError as e:
             logger.error(f"Failed to extract league and date: {e}")
             raise MatchParsingError(f"Failed to extract league and date: {e}") from e
 
     @classmethod
-    def _extract_teams(cls, soup: BeautifulSoup) -> tuple[str, str]:
-        """Extract teams from HTML."""
-        try:
-            whole_div = soup.find("div", class_=cls.TEAM_HEADERS_CLASS)
-            if not whole_div:
-                raise MatchParsingError("Failed to extract teams")
-            team_headers = whole_div.find_all("h3")
-            if not team_headers:
-                raise MatchParsingError("Failed to extract teams")
-            # Filter out quarter headers (contain "čtvrtina")
-            team_names = [
-                h3.get_text(strip=True) for h3 in team_headers if cls.QUARTER_HEADER_TEXT not in h3.get_text(strip=True)
-            ]
-            home_team = team_names[0] if len(team_names) > 0 else ""
-            away_team = team_names[1] if len(team_names) > 1 else ""
-        except AttributeError as e:
+    def _split_league_and_date(cls, date_league_text: str) -> tuple[str, datetime]:
+        """Split the "<date>, <league>" header text into league and match date."""
+        date_league_match = cls.DATE_LEAGUE_RE.match(date_league_text)
+        if not date_league_match:
+            raise ValueError(f"invalid date and league {date_league_text.strip()!r}")
+        match_date = datetime(
+            int(date_league_match["year"]),
+            int(date_league_match["month"]),
+            int(date_league_match["day"]),
+            int(date_league_match["hour"]),
+            int(date_league_match["minute"]),
+        )
+        return date_league_match["league"].strip(), match_date
+
+    @classmethod
+    def _is_team_header(cls, name: str) -> bool:
+        """Check whether a div.whole header is a team name rather than a quarter ("1. čtvrtina") or section header."""
+        return not name.endswith(cls.QUARTER_HEADER_TEXT) and name not in cls.NON_TEAM_HEADERS
+
+    @classmethod
+    def _extract_teams(cls, whole_div: HtmlElement) -> tuple[str, str]:
+        """Extract teams from the team headers div."""
+        team_headers = [h3.text_content().strip() for h3 in whole_div.iter("h3")]
+        if not team_headers:
             logger.error("Failed to extract teams")
-            raise MatchParsingError("Failed to extract teams") from e
+            raise MatchParsingError("Failed to extract teams")
+        team_names = list(islice(filter(cls._is_team_header, team_headers), 2))
+        home_team = team_names[0] if len(team_names) > 0 else ""
+        away_team = team_names[1] if len(team_names) > 1 else ""
         return home_team, away_team
 
     @classmethod
-    def _extract_score(cls, soup: BeautifulSoup) -> tuple[int, int] | tuple[None, None]:
-        """Extract score from HTML."""
+    def _extract_score(cls, score_div: HtmlElement) -> tuple[int, int] | tuple[None, None]:
+        """Extract score from the score div."""
+        score_text = score_div.text_content()
+        if cls.MATCH_FINISHED_TEXT not in score_text:
+            logger.info("Match is not finished yet. Skipping match.")
+            return None, None
+        score_match = cls.SCORE_RE.match(score_text)
+        if not score_match:
+            logger.error(f"Failed to extract score, invalid score format: {score_text.strip()!r}")
+            raise MatchParsingError(f"Failed to extract score, invalid score format: {score_text.strip()!r}")
+        return int(score_match["home"]), int(score_match["away"])
+
+    @classmethod
+    def _is_finished(cls, html: bytes) -> bool:
+        """Check whether the match is finished with a plain byte search, before any parsing.
+
+        The finished text can only be missing from a page of an unfinished match or from
+        a page without a score div, which is reported as a parsing error.
+
+        Raises:
+            MatchParsingError: If the match is not finished and the page has no score div.
+        """
+        if cls._MATCH_FINISHED_BYTES in html:
+            return True
+        if cls._SCORE_DIV_MARKER not in html:
+            logger.error("Failed to extract score")
+            raise MatchParsingError("Failed to extract score")
+        logger.info("Match is not finished yet. Skipping match.")
+        return False
+
+    @classmethod
+    def _decode(cls, raw: bytes) -> str:
+        """Decode a fragment of the raw page and resolve HTML entities."""
+        return unescape(raw.decode(cls.ENCODING, errors="replace")).strip()
+
+    @classmethod
+    def _fast_extract_teams(cls, html: bytes) -> tuple[str, str] | None:
+        """Extract the first two non-quarter team headers following div.whole, or None on a miss."""
+        start = html.find(cls._TEAM_HEADERS_MARKER)
+        if start == -1:
+            return None
+        headers = (cls._decode(header.group(1)) for header in cls._RE_TEAM_HEADER.finditer(html, start))
+        team_names = list(islice(filter(cls._is_team_header, headers), 2))
+        if len(team_names) < 2 or any("<" in name for name in team_names):
+            return None
+        return team_names[0], team_names[1]
+
+    @classmethod
+    def _parse_fields_fast(cls, html: bytes) -> tuple[str, datetime, str, str, int, int] | None:
+        """Extract match fields from raw HTML with regexes.
+
+        Returns None if any field cannot be matched or the match is not finished,
+        in which case the caller falls back to the DOM parser.
+        """
+        date_league = cls._RE_DATE_LEAGUE.search(html)
+        score = cls._RE_SCORE.search(html)
+        teams = cls._fast_extract_teams(html)
+        if not date_league or not score or not teams or score.group(3).strip() != cls._MATCH_FINISHED_BYTES:
+            return None
         try:
-            score_div = soup.find("div", class_=cls.SCORE_DIV_CLASS)
-            if not score_div:
-                raise MatchParsingError("Failed to extract score")
-            score_text = score_div.get_text(strip=False)
-            if cls.MATCH_FINISHED_TEXT not in score_text:
-                logger.info("Match is not finished yet. Skipping match.")
-                return None, None
-            score_text = score_text.split("\n")[1].strip()
-
-            home_score_str, away_score_str = score_text.split(":")
-            home_score = int(home_score_str.strip())
-            away_score = int(away_score_str.strip())
+            league, match_date = cls._split_league_and_date(cls._decode(date_league.group(1)))
+        except ValueError:
+            return None
+        return league, match_date, teams[0], teams[1], int(score.group(1)), int(score.group(2))
 
-        except ValueError as e:
-            logger.error(f"Failed to extract score: {e}")
-            raise MatchParsingError(f"Failed to extract score, invalid score format: {e}") from e
-        return home_score, away_score
-
-    @staticmethod
-    def _determine_winner(home_score: int, away_score: int) -> str:
-        """Determine winner from score."""
-        if home_score > away_score:
-            return "H"
-        if away_score > home_score:
-            return "A"
-        return "D"
+    @classmethod
+    def _strip_preamble(cls, html: bytes) -> bytes:
+        """Cut the page at the first div the extractors read, dropping the head, navigation and scripts before it."""
+        markers = (cls._DATE_LEAGUE_DIV_MARKER, cls._TEAM_HEADERS_MARKER, cls._SCORE_DIV_MARKER)
+        positions = [position for marker in markers if (position := html.find(marker)) != -1]
+        if not positions:
+            return html
+        start = html.rfind(b"<div", 0, min(positions))
+        return html[start:] if start != -1 else html
 
     @classmethod
-    def parse_match(cls, html: str, game_id: int) -> MatchModel | None:
-        """Parse match data from HTML."""
-        soup = BeautifulSoup(html, "lxml")
+    def _get_html_parser(cls) -> lxml_html.HTMLParser:
+        """Get the calling thread's HTML parser, creating it on first use.
+
+        The parser is told the page encoding, so it reads the raw bytes directly instead of
+        a decoded copy, and is reused for every page parsed on the thread.
+        """
+        parser = getattr(cls._parser_local, "parser", None)
+        if parser is None:
+            parser = cls._parser_local.parser = lxml_html.HTMLParser(encoding=cls.ENCODING)
+        return parser
+
+    @classmethod
+    def _parse_fields_dom(cls, html: bytes) -> tuple[str, datetime, str, str, int | None, int | None]:
+        """Extract match fields from the lxml DOM tree, built only from the part of the page the extractors read."""
+        try:
+            root = lxml_html.document_fromstring(cls._strip_preamble(html), parser=cls._get_html_parser())
+        except etree.ParserError as e:
+            logger.error(f"Failed to parse HTML: {e}")
+            raise MatchParsingError(f"Failed to parse HTML: {e}") from e
+
+        date_league_div, whole_div, score_div = cls._find_nodes(root)
 
         # 1. Extract date and league
-        league, match_date = cls._extract_league_and_date(soup)
+        league, match_date = cls._extract_league_and_date(date_league_div)
 
         # 2. Extract teams from div.whole
-        home_team, away_team = cls._extract_teams(soup)
+        home_team, away_team = cls._extract_teams(whole_div)
 
         # 3. Extract score
-        home_score, away_score = cls._extract_score(soup)
-        if not home_score or not away_score:
-            return None
+        home_score, away_score = cls._extract_score(score_div)
 
-        # 4. Determine winner
-        winner = cls._determine_winner(home_score, away_score)
+        return league, match_date, home_team, away_team, home_score, away_score
+
+    @classmethod
+    def parse_match(cls, html: bytes | str, game_id: int) -> MatchRow | None:
+        """Parse match data from HTML.
+
+        Pages of unfinished matches are skipped before any parsing. Well-formed pages are
+        handled by the regex fast path on the raw bytes, decoding only the matched fragments;
+        anything it cannot match falls back to the DOM parser.
+        """
+        if isinstance(html, str):
+            html = html.encode(cls.ENCODING)
+        if not cls._is_finished(html):
+            return None
+        fields = cls._parse_fields_fast(html) or cls._parse_fields_dom(html)
+        league, match_date, home_team, away_team, home_score, away_score = fields
+        if home_score is None or away_score is None:
+            return None
 
-        return MatchModel(
+        return MatchRow(
             game_id=game_id,
             home_team=home_team,
             away_team=away_team,
@@ -126,5 +267,4 @@ class MatchInfoParser:
             league=league,
             home_score=home_score,
             away_score=away_score,
-            winner=winner,
         )
@@ -1,26 +1,74 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+import contextlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from operator import attrgetter
+from typing import TYPE_CHECKING, ClassVar
 
-import pandas as pd
+import httpx
 from loguru import logger
 
+from cze_wp_scraper.scraper.cache import MatchPageCache
 from cze_wp_scraper.scraper.client import HTTPMatchClient
 from cze_wp_scraper.scraper.parser import MatchInfoParser
 from cze_wp_scraper.utils.exceptions import MatchParsingError
 
 if TYPE_CHECKING:
-    from cze_wp_scraper.models.match import MatchModel
+    from concurrent.futures import Executor
+    from pathlib import Path
+
+    import numpy as np
+    import pandas as pd
+
+    from cze_wp_scraper.models.row import MatchRow
+
+
+def _parse_match_worker(html: bytes, game_id: int) -> MatchRow | None:
+    """Parse a match page; module-level so it can be pickled into worker processes."""
+    return MatchInfoParser.parse_match(html, game_id)
 
 
 class MatchScraper:
     """Scraper for fetching and parsing multiple match data from csvp.cz."""
 
+    MAX_CONCURRENCY: ClassVar[int] = HTTPMatchClient.MAX_CONNECTIONS
+    # Column order of the scraped frame
+    COLUMNS: ClassVar[tuple[str, ...]] = (
+        "game_id",
+        "home_team",
+        "away_team",
+        "match_date",
+        "league",
+        "home_score",
+        "away_score",
+        "winner",
+    )
+    # Dtypes of the columns taken from the parsed rows. Strings are cast to "str" first so that an empty result
+    # still gets string categories below.
+    DTYPES: ClassVar[dict[str, str]] = {
+        "game_id": "int64",
+        "home_team": "str",
+        "away_team": "str",
+        "match_date": "datetime64[us]",
+        "league": "str",
+        "home_score": "int64",
+        "away_score": "int64",
+    }
+    # Low-cardinality string columns stored as categoricals to avoid one Python string per row
+    CATEGORICAL_COLUMNS: ClassVar[tuple[str, ...]] = ("home_team", "away_team", "league")
+    WINNER_CATEGORIES: ClassVar[tuple[str, ...]] = ("H", "A", "D")
+
     def __init__(
         self,
         base_url: str | None = None,
         timeout: float | None = None,
         user_agent: str | None = None,
+        cache_dir: str | Path | None = None,
+        refresh_cache: bool = False,
+        parse_workers: int | None = None,
+        concurrency: int | None = None,
     ):
         """Initialize the scraper.
 
@@ -28,24 +76,113 @@ class MatchScraper:
             base_url: Optional base URL for the HTTP client. Uses default if None.
             timeout: Optional timeout for the HTTP client. Uses default if None.
             user_agent: Optional user agent for the HTTP client. Uses default if None.
+            cache_dir: Optional directory for caching finished match pages. Caching is disabled if None.
+            refresh_cache: If True, re-download pages even if they are cached.
+            parse_workers: Optional number of worker processes used for parsing. Pages are parsed in the event
+                loop's default thread pool if None, which is faster unless the DOM fallback parser is hit often,
+                since shipping a page to a process costs more than the fast path takes to parse it. Worker
+                processes are spawned, so scripts that set this must guard their entry point with
+                `if __name__ == "__main__":`.
+            concurrency: Optional maximum number of requests in flight at once. Uses MAX_CONCURRENCY if None.
+
+        Raises:
+            ValueError: If concurrency is less than 1.
         """
-        self.base_url = base_url
-        self.timeout = timeout
-        self.user_agent = user_agent
+        if concurrency is not None and concurrency < 1:
+            logger.error(f"concurrency must be at least 1, got {concurrency}")
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        self._base_url = base_url
+        self._timeout = timeout
+        self._user_agent = user_agent
+        # Client kwargs only depend on the read-only client options, so they are built once rather than per client
+        self._client_kwargs: dict[str, str | float] = {
+            name: value
+            for name, value in (("base_url", base_url), ("timeout", timeout), ("user_agent", user_agent))
+            if value is not None
+        }
+        self.cache = MatchPageCache(cache_dir, refresh=refresh_cache) if cache_dir is not None else None
+        self.parse_workers = parse_workers
+        self.concurrency = concurrency if concurrency is not None else self.MAX_CONCURRENCY
+        # Set while the scraper is used as a context manager, so consecutive scrapes share one event loop, HTTP
+        # client and parse executor
+        self._runner: asyncio.Runner | None = None
+        self._exit_stack: contextlib.AsyncExitStack | None = None
+        self._client: HTTPMatchClient | None = None
+        self._executor: Executor | None = None
+
+    @property
+    def base_url(self) -> str | None:
+        """Base URL passed to the HTTP client, or None for the client default."""
+        return self._base_url
+
+    @property
+    def timeout(self) -> float | None:
+        """Timeout passed to the HTTP client, or None for the client default."""
+        return self._timeout
+
+    @property
+    def user_agent(self) -> str | None:
+        """User agent passed to the HTTP client, or None for the client default."""
+        return self._user_agent
+
+    def __enter__(self):
+        """Context manager entry.
+
+        Opens one HTTP client, together with the event loop it is bound to, and the parse process
+        pool if parse_workers is set. They are reused by every scrape_matches call until exit, so
+        later calls skip the TCP and TLS handshakes and the worker start-up.
+        """
+        runner = asyncio.Runner()
+        exit_stack = contextlib.AsyncExitStack()
+        try:
+            executor = exit_stack.enter_context(self._executor_context())
+            client = HTTPMatchClient(**self._get_client_kwargs())  # type: ignore[arg-type]
+            self._client = runner.run(exit_stack.enter_async_context(client))
+        except BaseException:
+            try:
+                runner.run(exit_stack.aclose())
+            finally:
+                runner.close()
+            raise
+        self._runner = runner
+        self._exit_stack = exit_stack
+        self._executor = executor
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        runner, exit_stack = self._runner, self._exit_stack
+        self._runner = self._exit_stack = self._client = self._executor = None
+        if runner is None or exit_stack is None:
+            return
+        try:
+            runner.run(exit_stack.__aexit__(exc_type, exc_val, exc_tb))
+        finally:
+            runner.close()
 
     def _get_client_kwargs(self) -> dict[str, str | float]:
-        """Get client initialization kwargs from instance attributes."""
-        client_kwargs: dict[str, str | float] = {}
-        if self.base_url is not None:
-            client_kwargs["base_url"] = self.base_url
-        if self.timeout is not None:
-            client_kwargs["timeout"] = self.timeout
-        if self.user_agent is not None:
-            client_kwargs["user_agent"] = self.user_agent
-        return client_kwargs
+        """Get client initialization kwargs, leaving out the options that were not given to the constructor."""
+        return self._client_kwargs
+
+    def _executor_context(self) -> contextlib.AbstractContextManager[Executor | None]:
+        """Get the process pool used for parsing if parse_workers is set, otherwise None for the default thread pool.
+
+        Inside the context manager, the executor it opened is returned without closing it after use.
+        """
+        if self._runner is not None or self.parse_workers is None:
+            return contextlib.nullcontext(self._executor)
+        # Spawn fresh interpreters: forking the event loop's process once it has helper threads may deadlock
+        mp_context = multiprocessing.get_context("spawn")
+        return ProcessPoolExecutor(max_workers=self.parse_workers, mp_context=mp_context)
+
+    def _client_context(self) -> contextlib.AbstractAsyncContextManager[HTTPMatchClient]:
+        """Get the client kept open by the context manager, or a new one that is closed after use."""
+        if self._client:
+            return contextlib.nullcontext(self._client)
+        return HTTPMatchClient(**self._get_client_kwargs())  # type: ignore[arg-type]
 
     @staticmethod
-    def _scrape_single_match(client: HTTPMatchClient, game_id: int) -> MatchModel | None:
+    def _scrape_single_match(client: HTTPMatchClient, game_id: int) -> MatchRow | None:
         """Scrape a single match.
 
         Args:
@@ -53,7 +190,7 @@ class MatchScraper:
             game_id: Game ID to scrape.
 
         Returns:
-            MatchModel if successful, None if failed.
+            MatchRow if successful, None if failed.
         """
         try:
             html = client.fetch_match(game_id)
@@ -63,45 +200,119 @@ class MatchScraper:
             return None
 
     @staticmethod
-    def _matches_to_dataframe(matches: list[MatchModel]) -> pd.DataFrame:
-        """Convert list of MatchModel to pandas DataFrame.
+    async def _scrape_single_match_async(
+        client: HTTPMatchClient,
+        game_id: int,
+        cache: MatchPageCache | None = None,
+        executor: Executor | None = None,
+        not_found: set[int] | None = None,
+    ) -> MatchRow | None:
+        """Scrape a single match using the async client.
+
+        Cache reads and writes run in a worker thread and parsing in the given executor, so neither blocks the event loop.
+        Only pages of finished matches are written to the cache, since they no longer change.
+        Game IDs that fail to parse are marked bad in the cache; unfinished matches are not,
+        since they will be scraped once they finish. Game IDs that return 404 are only added
+        to not_found, since they may be matches that do not exist yet. Other HTTP and transport
+        errors that outlast the client's retries are logged and skipped without marking the
+        game ID, so one flaky request does not discard the rest of the batch.
+
+        Args:
+            client: HTTP client instance entered as async context manager.
+            game_id: Game ID to scrape.
+            cache: Optional page cache consulted before fetching.
+            executor: Optional executor used for parsing. Uses the event loop's default thread pool if None.
+            not_found: Optional set collecting game IDs that returned 404.
+
+        Returns:
+            MatchRow if successful, None if failed.
+        """
+        cached_html = await asyncio.to_thread(cache.get, game_id) if cache else None
+        try:
+            html = cached_html or await client.fetch_match_async(game_id)
+            loop = asyncio.get_running_loop()
+            match_data = await loop.run_in_executor(executor, _parse_match_worker, html, game_id)
+        except (httpx.HTTPError, MatchParsingError) as e:
+            MatchScraper._handle_failed_match(e, game_id, cache, not_found)
+            return None
+        if cache and match_data is not None and cached_html is None:
+            await asyncio.to_thread(cache.set, game_id, html)
+        return match_data
+
+    @staticmethod
+    def _handle_failed_match(
+        error: Exception, game_id: int, cache: MatchPageCache | None, not_found: set[int] | None = None
+    ) -> None:
+        """Log a match that failed to fetch or parse, recording a 404 in not_found and marking a parse failure bad.
+
+        Other HTTP and transport errors may be transient, so the game ID is neither recorded nor marked.
+        """
+        logger.error(f"Failed to scrape match {game_id}: {error}")
+        if isinstance(error, MatchParsingError):
+            if cache:
+                cache.mark_bad(game_id)
+        elif (
+            isinstance(error, httpx.HTTPStatusError)
+            and error.response.status_code == httpx.codes.NOT_FOUND
+            and not_found is not None
+        ):
+            not_found.add(game_id)
+
+    def _mark_not_found_bad(self, not_found: set[int], game_ids: list[int], results: list[MatchRow | None]) -> None:
+        """Mark game IDs that returned 404 bad in the cache if they are below the highest one that was scraped.
+
+        Game IDs above the newest match return 404 only because the match does not exist yet, so
+        they are left out to be fetched again on later runs.
+        """
+        if not self.cache:
+            return
+        latest = max(
+            (game_id for game_id, match_data in zip(game_ids, results, strict=True) if match_data is not None),
+            default=0,
+        )
+        for game_id in not_found:
+            if game_id < latest:
+                self.cache.mark_bad(game_id)
+
+    def _drop_known_bad(self, game_ids: list[int]) -> list[int]:
+        """Filter out game IDs that the cache knows to be missing or unparseable."""
+        if not self.cache:
+            return game_ids
+        remaining = [game_id for game_id in game_ids if not self.cache.is_bad(game_id)]
+        if len(remaining) < len(game_ids):
+            logger.info(f"Skipping {len(game_ids) - len(remaining)} known bad game IDs")
+        return remaining
+
+    @staticmethod
+    def _determine_winners(home_scores: np.ndarray, away_scores: np.ndarray) -> pd.Categorical:
+        """Determine winners ("H", "A" or "D") from home and away score arrays in one vectorized pass."""
+        import numpy as np
+        import pandas as pd
+
+        # np.sign(away - home) is -1, 0 or 1; shifted by one it indexes the code of "H", "D" or "A" in WINNER_CATEGORIES
+        codes = np.array((0, 2, 1), dtype=np.int8)[np.sign(away_scores - home_scores) + 1]
+        return pd.Categorical.from_codes(codes, categories=MatchScraper.WINNER_CATEGORIES)
+
+    @staticmethod
+    def _matches_to_dataframe(matches: list[MatchRow]) -> pd.DataFrame:
+        """Convert list of MatchRow to pandas DataFrame.
 
         Args:
-            matches: List of MatchModel objects.
+            matches: List of MatchRow objects.
 
         Returns:
             pandas DataFrame with match data.
         """
-        if not matches:
-            # Return empty DataFrame with correct columns if no matches
-            return pd.DataFrame(
-                columns=[
-                    "game_id",
-                    "home_team",
-                    "away_team",
-                    "match_date",
-                    "league",
-                    "home_score",
-                    "away_score",
-                    "winner",
-                ]
-            )
-
-        # Convert MatchModel objects to dictionaries
-        match_dicts = [match.model_dump() for match in matches]
-
-        # Create DataFrame with correct column order
-        column_order = [
-            "game_id",
-            "home_team",
-            "away_team",
-            "match_date",
-            "league",
-            "home_score",
-            "away_score",
-            "winner",
-        ]
-        return pd.DataFrame(match_dicts)[column_order]
+        # Imported here rather than at module level: parse worker processes import this module but never build frames
+        import pandas as pd
+
+        # Build the frame column by column instead of dumping every row to a dict. Casting to DTYPES also gives an
+        # empty result the same schema as a non-empty one.
+        columns = {column: list(map(attrgetter(column), matches)) for column in MatchScraper.DTYPES}
+        df = pd.DataFrame(columns).astype(MatchScraper.DTYPES)
+        df = df.astype(dict.fromkeys(MatchScraper.CATEGORICAL_COLUMNS, "category"))
+        df["winner"] = MatchScraper._determine_winners(df["home_score"].to_numpy(), df["away_score"].to_numpy())
+        return df[list(MatchScraper.COLUMNS)]
 
     def scrape_matches(self, game_ids: list[int]) -> pd.DataFrame:
         """Scrape match data for a list of game IDs.
@@ -110,7 +321,7 @@ class MatchScraper:
             game_ids: List of game IDs to scrape.
 
         Returns:
-            pandas DataFrame with columns matching MatchModel fields:
+            pandas DataFrame with columns matching MatchRow fields:
             - game_id
             - home_team
             - away_team
@@ -122,14 +333,43 @@ class MatchScraper:
 
         Note:
             Games that fail to fetch or parse are skipped (not included in the result).
+            With caching enabled, game IDs known to be missing or unparseable from
+            previous runs are not fetched at all.
         """
-        matches: list[MatchModel] = []
+        if self._runner:
+            return self._runner.run(self._scrape_matches_async(game_ids))
+        return asyncio.run(self._scrape_matches_async(game_ids))
+
+    async def _scrape_matches_async(self, game_ids: list[int]) -> pd.DataFrame:
+        """Fetch matches concurrently, bounded by self.concurrency in-flight requests, and parse them off the event loop."""
+        game_ids = self._drop_known_bad(game_ids)
+        semaphore = asyncio.Semaphore(self.concurrency)
+        not_found: set[int] = set()
+
+        with self._executor_context() as executor:
+            async with self._client_context() as client:
+
+                async def bounded(game_id: int) -> MatchRow | None:
+                    async with semaphore:
+                        match_data = await self._scrape_single_match_async(
+                            client, game_id, self.cache, executor, not_found
+                        )
+                    if match_data is not None:
+                        logger.info(f"Scraped match {game_id} successfully")
+                    return match_data
+
+                # A TaskGroup cancels the sibling fetches if one raises, so none of them outlives this call on a
+                # persistent runner; the tasks are kept in input order, whatever order the fetches finish in
+                try:
+                    async with asyncio.TaskGroup() as task_group:
+                        tasks = [task_group.create_task(bounded(game_id)) for game_id in game_ids]
+                except ExceptionGroup as group:
+                    logger.error(f"Scraping aborted: {group.exceptions[0]}")
+                    raise group.exceptions[0] from None
+                results = [task.result() for task in tasks]
 
-        with HTTPMatchClient(**self._get_client_kwargs()) as client:  # type: ignore[arg-type]
-            for game_id in game_ids:
-                match_data = self._scrape_single_match(client, game_id)
-                if match_data is not None:
-                    logger.info(f"Scraped match {game_id} successfully")
-                    matches.append(match_data)
+        if self.cache:
+            self._mark_not_found_bad(not_found, game_ids, results)
+            self.cache.save_bad_ids()
 
-        return self._matches_to_dataframe(matches)
+        return self._matches_to_dataframe([match_data for match_data in results if match_data is not None])
@@ -2,6 +2,9 @@ from __future__ import annotations
 
 from datetime import datetime
 
+import pytest
+from pydantic import ValidationError
+
 from cze_wp_scraper.models.match import MatchModel
 from cze_wp_scraper.utils.constants import Constants
 
@@ -52,3 +55,60 @@ class TestMatchModel:
         assert match_model.home_score == 1
         assert match_model.away_score == 2
         assert match_model.winner == "H"
+
+    @pytest.mark.parametrize(
+        "match_date",
+        ["21.12.2025 11:00:00", "01.01.2024 00:00:00", "1.1.2024 9:05:00"],
+    )
+    def test_validate_match_date_matches_strptime(self, match_date: str) -> None:
+        """Test that string dates parse the same as with strptime, padded or not."""
+        match_model = MatchModel(
+            game_id=1,
+            home_team="Home Team",
+            away_team="Away Team",
+            match_date=match_date,
+            league="League",
+            home_score=1,
+            away_score=2,
+            winner="H",
+        )
+        assert match_model.match_date == datetime.strptime(match_date, Constants.OUTPUT_DATE_FORMAT)
+
+    @pytest.mark.parametrize(
+        "match_date",
+        [
+            "32.12.2025 11:00:00",
+            "21-12-2025 11:00:00",
+            "21.12.2025 11:00",
+            "+1.12.2025 11:00:00",
+            "21.12.2_25 11:00:00",
+            "21.12.2025 1 :00:00",
+        ],
+    )
+    def test_validate_match_date_invalid(self, match_date: str) -> None:
+        """Test that invalid string dates are rejected."""
+        with pytest.raises(ValidationError):
+            MatchModel(
+                game_id=1,
+                home_team="Home Team",
+                away_team="Away Team",
+                match_date=match_date,
+                league="League",
+                home_score=1,
+                away_score=2,
+                winner="H",
+            )
+
+    def test_validate_match_date_out_of_range_reports_format(self) -> None:
+        """Test that a well-shaped but out-of-range date is rejected with strptime's format error."""
+        with pytest.raises(ValidationError, match="does not match format"):
+            MatchModel(
+                game_id=1,
+                home_team="Home Team",
+                away_team="Away Team",
+                match_date="32.13.2024 25:00:00",
+                league="League",
+                home_score=1,
+                away_score=2,
+                winner="H",
+            )
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import dataclasses
+from datetime import datetime
+
+import pytest
+
+from cze_wp_scraper.models.match import MatchModel
+from cze_wp_scraper.models.row import MatchRow
+
+
+class TestMatchRow:
+    """Test cases for MatchRow."""
+
+    def test_fields_match_model(self) -> None:
+        """Test that MatchRow mirrors the MatchModel fields in order."""
+        assert [field.name for field in dataclasses.fields(MatchRow)] == list(MatchModel.model_fields)
+
+    def test_frozen(self) -> None:
+        """Test that MatchRow instances are immutable."""
+        match_row = MatchRow(
+            game_id=1,
+            home_team="Home Team",
+            away_team="Away Team",
+            match_date=datetime(2025, 12, 21, 11, 0, 0),
+            league="League",
+            home_score=1,
+            away_score=2,
+            winner="A",
+        )
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            match_row.home_score = 3  # type: ignore[misc]
+        assert not hasattr(match_row, "__dict__")
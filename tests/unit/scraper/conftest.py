@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from cze_wp_scraper.models.row import MatchRow
+
+# Get the path to the example HTML fixture
+FIXTURES_DIR = Path(__file__).parent.parent.parent / "fixtures"
+EXAMPLE_HTML_PATH = FIXTURES_DIR / "example_match.html"
+
+
+@pytest.fixture(scope="session")
+def example_html() -> bytes:
+    """Load example HTML from fixture file once per test session."""
+    return EXAMPLE_HTML_PATH.read_bytes()
+
+
+@pytest.fixture(scope="session")
+def example_match_model() -> MatchRow:
+    """Create a sample MatchRow for testing; it is frozen, so one instance is shared by all tests."""
+    return MatchRow(
+        game_id=2425,
+        home_team="UKVP Stepp Praha",
+        away_team="SK UP Olomouc",
+        match_date=datetime(2025, 12, 21, 11, 0),
+        league="1. liga mužů - základní část",
+        home_score=33,
+        away_score=5,
+        winner="H",
+    )
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from cze_wp_scraper.scraper.cache import MatchPageCache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class TestMatchPageCache:
+    """Test cases for MatchPageCache."""
+
+    def test_init_defaults(self) -> None:
+        """Test MatchPageCache initialization with default values."""
+        cache = MatchPageCache()
+        assert str(cache.cache_dir) == ".cache/csvp"
+        assert cache.refresh is False
+
+    def test_get_missing(self, tmp_path: Path) -> None:
+        """Test get returns None for a page that is not cached."""
+        cache = MatchPageCache(tmp_path)
+        assert cache.get(2425) is None
+
+    def test_set_and_get(self, tmp_path: Path) -> None:
+        """Test that a stored page is returned by get."""
+        cache = MatchPageCache(tmp_path / "nested")
+        cache.set(2425, "<html>Ukončené utkání</html>".encode())
+
+        assert cache.get(2425) == "<html>Ukončené utkání</html>".encode()
+        assert (tmp_path / "nested" / "2425.html").exists()
+        assert not (tmp_path / "nested" / "2425.tmp").exists()
+
+    def test_set_overwrites(self, tmp_path: Path) -> None:
+        """Test that set overwrites an existing page."""
+        cache = MatchPageCache(tmp_path)
+        cache.set(2425, b"old")
+        cache.set(2425, b"new")
+
+        assert cache.get(2425) == b"new"
+
+    def test_refresh_ignores_cached_pages(self, tmp_path: Path) -> None:
+        """Test that refresh skips reads but still writes pages."""
+        MatchPageCache(tmp_path).set(2425, b"old")
+        cache = MatchPageCache(tmp_path, refresh=True)
+
+        assert cache.get(2425) is None
+        cache.set(2425, b"new")
+        assert MatchPageCache(tmp_path).get(2425) == b"new"
+
+    def test_bad_ids_round_trip(self, tmp_path: Path) -> None:
+        """Test that marked bad game IDs are persisted by save_bad_ids."""
+        cache = MatchPageCache(tmp_path)
+        cache.mark_bad(7)
+        cache.mark_bad(3)
+
+        assert cache.is_bad(7)
+        assert not MatchPageCache(tmp_path).is_bad(7)
+
+        cache.save_bad_ids()
+        reloaded = MatchPageCache(tmp_path)
+        assert reloaded.is_bad(3)
+        assert reloaded.is_bad(7)
+        assert not reloaded.is_bad(5)
+        assert (tmp_path / MatchPageCache.BAD_IDS_FILENAME).read_text(encoding="utf-8") == "[3, 7]"
+
+    def test_save_bad_ids_noop_when_unchanged(self, tmp_path: Path) -> None:
+        """Test that save_bad_ids does not write a file when nothing was marked."""
+        MatchPageCache(tmp_path / "nested").save_bad_ids()
+
+        assert not (tmp_path / "nested").exists()
+
+    def test_refresh_ignores_bad_ids(self, tmp_path: Path) -> None:
+        """Test that refresh forgets known bad game IDs and overwrites them on save."""
+        cache = MatchPageCache(tmp_path)
+        cache.mark_bad(3)
+        cache.save_bad_ids()
+
+        refreshed = MatchPageCache(tmp_path, refresh=True)
+        assert not refreshed.is_bad(3)
+        refreshed.mark_bad(4)
+        refreshed.save_bad_ids()
+
+        reloaded = MatchPageCache(tmp_path)
+        assert not reloaded.is_bad(3)
+        assert reloaded.is_bad(4)
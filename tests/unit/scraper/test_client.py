@@ -1,36 +1,50 @@
 from __future__ import annotations
 
-from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
 
 from cze_wp_scraper.scraper.client import HTTPMatchClient
 
-# Get the path to the example HTML fixture
-FIXTURES_DIR = Path(__file__).parent.parent.parent / "fixtures"
-EXAMPLE_HTML_PATH = FIXTURES_DIR / "example_match.html"
-
-
-@pytest.fixture
-def example_html() -> str:
-    """Load example HTML from fixture file."""
-    return EXAMPLE_HTML_PATH.read_text(encoding="utf-8")
-
 
 @pytest.fixture
-def mock_httpx_client(example_html: str) -> MagicMock:
+def mock_httpx_client(example_html: bytes) -> MagicMock:
     """Create a mocked httpx.Client that returns example HTML."""
     mock_client = MagicMock(spec=httpx.Client)
     mock_response = MagicMock(spec=httpx.Response)
-    mock_response.text = example_html
+    mock_response.content = example_html
     mock_response.status_code = 200
     mock_response.raise_for_status = MagicMock()
     mock_client.get.return_value = mock_response
     return mock_client
 
 
+@pytest.fixture
+def mock_async_httpx_client(example_html: bytes) -> MagicMock:
+    """Create a mocked httpx.AsyncClient that returns example HTML."""
+    mock_client = MagicMock(spec=httpx.AsyncClient)
+    mock_response = MagicMock(spec=httpx.Response)
+    mock_response.content = example_html
+    mock_response.status_code = 200
+    mock_response.raise_for_status = MagicMock()
+    mock_client.get = AsyncMock(return_value=mock_response)
+    mock_client.aclose = AsyncMock()
+    return mock_client
+
+
+def _status_response(status_code: int) -> MagicMock:
+    """Create a mocked httpx.Response with the given status code."""
+    mock_response = MagicMock(spec=httpx.Response)
+    mock_response.status_code = status_code
+    mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
+        f"{status_code} Error",
+        request=MagicMock(),
+        response=mock_response,
+    )
+    return mock_response
+
+
 class TestMatchClient:
     """Test cases for MatchClient."""
 
@@ -69,6 +83,32 @@ class TestMatchClient:
                 assert mock_client_class.call_args[1]["timeout"] == 30.0
                 assert "User-Agent" in mock_client_class.call_args[1]["headers"]
 
+    def test_context_manager_configures_transport(self) -> None:
+        """Test that httpx.Client uses an HTTP/2 transport with a keep-alive pool and connection retries."""
+        with (
+            patch("cze_wp_scraper.scraper.client.httpx.Client") as mock_client_class,
+            patch("cze_wp_scraper.scraper.client.httpx.HTTPTransport") as mock_transport_class,
+            HTTPMatchClient(),
+        ):
+            assert mock_client_class.call_args[1]["transport"] is mock_transport_class.return_value
+            transport_kwargs = mock_transport_class.call_args[1]
+            assert transport_kwargs["http2"] is True
+            assert transport_kwargs["retries"] == HTTPMatchClient.CONNECT_RETRIES
+            assert transport_kwargs["limits"].max_keepalive_connections == HTTPMatchClient.MAX_CONNECTIONS
+            assert transport_kwargs["limits"].keepalive_expiry == HTTPMatchClient.KEEPALIVE_EXPIRY
+
+    def test_ssl_context_shared(self) -> None:
+        """Test that all clients reuse one SSL context."""
+        with patch("cze_wp_scraper.scraper.client.httpx.HTTPTransport") as mock_transport_class:
+            with HTTPMatchClient():
+                pass
+            with HTTPMatchClient():
+                pass
+
+            first, second = (call[1]["verify"] for call in mock_transport_class.call_args_list)
+            assert first is second
+            assert first is HTTPMatchClient._get_ssl_context()
+
     def test_context_manager_closes_client(self) -> None:
         """Test that context manager closes httpx.Client on exit."""
         with patch("cze_wp_scraper.scraper.client.httpx.Client") as mock_client_class:
@@ -92,7 +132,7 @@ class TestMatchClient:
 
             mock_client.close.assert_not_called()
 
-    def test_fetch_match_success(self, example_html: str, mock_httpx_client: MagicMock) -> None:
+    def test_fetch_match_success(self, example_html: bytes, mock_httpx_client: MagicMock) -> None:
         """Test successful match fetch."""
         with (
             patch("cze_wp_scraper.scraper.client.httpx.Client", return_value=mock_httpx_client),
@@ -104,7 +144,7 @@ class TestMatchClient:
             mock_httpx_client.get.assert_called_once_with("https://www.csvp.cz/zapas/2425")
             mock_httpx_client.get.return_value.raise_for_status.assert_called_once()
 
-    def test_fetch_match_custom_base_url(self, example_html: str, mock_httpx_client: MagicMock) -> None:
+    def test_fetch_match_custom_base_url(self, example_html: bytes, mock_httpx_client: MagicMock) -> None:
         """Test fetch_match with custom base_url."""
         with (
             patch("cze_wp_scraper.scraper.client.httpx.Client", return_value=mock_httpx_client),
@@ -221,7 +261,7 @@ class TestMatchClient:
                 headers = mock_client_class.call_args[1]["headers"]
                 assert headers["User-Agent"] == custom_agent
 
-    def test_fetch_match_multiple_calls(self, example_html: str, mock_httpx_client: MagicMock) -> None:
+    def test_fetch_match_multiple_calls(self, example_html: bytes, mock_httpx_client: MagicMock) -> None:
         """Test multiple fetch_match calls reuse the same client."""
         with (
             patch("cze_wp_scraper.scraper.client.httpx.Client", return_value=mock_httpx_client),
@@ -235,3 +275,89 @@ class TestMatchClient:
             assert mock_httpx_client.get.call_count == 2
             assert mock_httpx_client.get.call_args_list[0][0][0] == "https://www.csvp.cz/zapas/2425"
             assert mock_httpx_client.get.call_args_list[1][0][0] == "https://www.csvp.cz/zapas/2426"
+
+    @pytest.mark.asyncio
+    async def test_async_context_manager_creates_and_closes_client(self, mock_async_httpx_client: MagicMock) -> None:
+        """Test that async context manager creates and closes httpx.AsyncClient."""
+        with patch(
+            "cze_wp_scraper.scraper.client.httpx.AsyncClient", return_value=mock_async_httpx_client
+        ) as mock_client_class:
+            async with HTTPMatchClient(timeout=60.0) as client:
+                assert client._async_client is mock_async_httpx_client
+                assert mock_client_class.call_args[1]["timeout"] == 60.0
+                assert "User-Agent" in mock_client_class.call_args[1]["headers"]
+
+            mock_async_httpx_client.aclose.assert_awaited_once()
+            assert client._async_client is None
+
+    @pytest.mark.asyncio
+    async def test_fetch_match_async_success(self, example_html: bytes, mock_async_httpx_client: MagicMock) -> None:
+        """Test successful async match fetch."""
+        with patch("cze_wp_scraper.scraper.client.httpx.AsyncClient", return_value=mock_async_httpx_client):
+            async with HTTPMatchClient() as client:
+                result = await client.fetch_match_async(2425)
+
+        assert result == example_html
+        mock_async_httpx_client.get.assert_awaited_once_with("https://www.csvp.cz/zapas/2425")
+
+    @pytest.mark.asyncio
+    async def test_fetch_match_async_without_context_manager(self) -> None:
+        """Test fetch_match_async raises RuntimeError when not used as async context manager."""
+        client = HTTPMatchClient()
+        with pytest.raises(RuntimeError, match="MatchClient must be used as async context manager"):
+            await client.fetch_match_async(2425)
+
+    @pytest.mark.asyncio
+    async def test_fetch_match_async_invalid_id(self) -> None:
+        """Test fetch_match_async raises ValueError for non-positive match_id."""
+        client = HTTPMatchClient()
+        with pytest.raises(ValueError, match="match_id must be positive, got 0"):
+            await client.fetch_match_async(0)
+
+    @pytest.mark.asyncio
+    async def test_fetch_match_async_retries_on_server_error(
+        self, example_html: bytes, mock_async_httpx_client: MagicMock
+    ) -> None:
+        """Test fetch_match_async retries 429/5xx responses with backoff."""
+        ok_response = mock_async_httpx_client.get.return_value
+        mock_async_httpx_client.get.side_effect = [_status_response(503), _status_response(429), ok_response]
+
+        with (
+            patch("cze_wp_scraper.scraper.client.httpx.AsyncClient", return_value=mock_async_httpx_client),
+            patch("cze_wp_scraper.scraper.client.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            async with HTTPMatchClient() as client:
+                result = await client.fetch_match_async(2425)
+
+        assert result == example_html
+        assert mock_async_httpx_client.get.await_count == 3
+        assert [call.args[0] for call in mock_sleep.await_args_list] == [0.5, 1.0]
+
+    @pytest.mark.asyncio
+    async def test_fetch_match_async_retries_exhausted(self, mock_async_httpx_client: MagicMock) -> None:
+        """Test fetch_match_async raises once retries are exhausted."""
+        mock_async_httpx_client.get.return_value = _status_response(500)
+
+        with (
+            patch("cze_wp_scraper.scraper.client.httpx.AsyncClient", return_value=mock_async_httpx_client),
+            patch("cze_wp_scraper.scraper.client.asyncio.sleep", new_callable=AsyncMock),
+            pytest.raises(httpx.HTTPStatusError),
+        ):
+            async with HTTPMatchClient() as client:
+                await client.fetch_match_async(2425)
+
+        assert mock_async_httpx_client.get.await_count == HTTPMatchClient.MAX_RETRIES + 1
+
+    @pytest.mark.asyncio
+    async def test_fetch_match_async_no_retry_on_404(self, mock_async_httpx_client: MagicMock) -> None:
+        """Test fetch_match_async does not retry client errors."""
+        mock_async_httpx_client.get.return_value = _status_response(404)
+
+        with (
+            patch("cze_wp_scraper.scraper.client.httpx.AsyncClient", return_value=mock_async_httpx_client),
+            pytest.raises(httpx.HTTPStatusError),
+        ):
+            async with HTTPMatchClient() as client:
+                await client.fetch_match_async(9999)
+
+        mock_async_httpx_client.get.assert_awaited_once()
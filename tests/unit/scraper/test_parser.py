@@ -1,34 +1,46 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import patch
 
 import pytest
-from bs4 import BeautifulSoup
+from lxml import html as lxml_html
 
-from cze_wp_scraper.models.match import MatchModel
+from cze_wp_scraper.models.row import MatchRow
 from cze_wp_scraper.scraper.parser import MatchInfoParser
 from cze_wp_scraper.utils.exceptions import MatchParsingError
 
-# Get the path to the example HTML fixture
-FIXTURES_DIR = Path(__file__).parent.parent.parent / "fixtures"
-EXAMPLE_HTML_PATH = FIXTURES_DIR / "example_match.html"
+if TYPE_CHECKING:
+    from lxml.html import HtmlElement
 
 
-@pytest.fixture
-def example_html() -> str:
-    """Load example HTML from fixture file."""
-    return EXAMPLE_HTML_PATH.read_text(encoding="utf-8")
+@pytest.fixture(scope="session")
+def example_text(example_html: bytes) -> str:
+    """Decode the shared example HTML once per test session; the parser tests work with text."""
+    return example_html.decode("utf-8")
+
+
+@pytest.fixture(scope="session")
+def example_tree(example_text: str) -> HtmlElement:
+    """Parse the example HTML once per test session; the helpers under test only read the tree."""
+    return lxml_html.document_fromstring(example_text)
+
+
+def _find_div(html: str, class_name: str) -> HtmlElement:
+    """Parse HTML and return the first div with the given class."""
+    return lxml_html.document_fromstring(html).xpath("//div[@class=$cls]", cls=class_name)[0]
 
 
 class TestMatchInfoParser:
     """Test cases for MatchInfoParser."""
 
-    def test_parse_match_success(self, example_html: str) -> None:
+    def test_parse_match_success(self, example_text: str) -> None:
         """Test successful parsing of match data."""
-        result = MatchInfoParser.parse_match(example_html, game_id=2425)
+        result = MatchInfoParser.parse_match(example_text, game_id=2425)
 
-        assert isinstance(result, MatchModel)
+        assert isinstance(result, MatchRow)
         assert result.game_id == 2425
         assert result.home_team == "UKVP Stepp Praha"
         assert result.away_team == "SK UP Olomouc"
@@ -42,16 +54,15 @@ class TestMatchInfoParser:
         assert result.league == "1. liga mužů - základní část"
         assert result.home_score == 33
         assert result.away_score == 5
-        assert result.winner == "H"
+        assert result.winner is None
 
-    def test_extract_league_and_date(self, example_html: str) -> None:
+    def test_extract_league_and_date(self, example_tree: HtmlElement) -> None:
         """Test extraction of league and date."""
 
-        soup = BeautifulSoup(example_html, "lxml")
-        league, match_date = MatchInfoParser._extract_league_and_date(soup)
+        league, match_date = MatchInfoParser._extract_league_and_date(MatchInfoParser._find_nodes(example_tree)[0])
 
         assert league == "1. liga mužů - základní část"
-        assert match_date == "21.12.2025 11:00:00"
+        assert match_date == datetime(2025, 12, 21, 11, 0)
 
     def test_extract_league_and_date_missing_comma(self) -> None:
         """Test extraction when comma is missing."""
@@ -64,9 +75,8 @@ class TestMatchInfoParser:
         </div>
         """
 
-        soup = BeautifulSoup(html, "lxml")
         with pytest.raises(MatchParsingError):
-            MatchInfoParser._extract_league_and_date(soup)
+            MatchInfoParser._extract_league_and_date(_find_div(html, MatchInfoParser.DATE_LEAGUE_TEXT_CLASS))
 
     def test_extract_league_and_date_no_place(self) -> None:
         """Test extraction when place div is missing."""
@@ -78,17 +88,46 @@ class TestMatchInfoParser:
         </div>
         """
 
-        soup = BeautifulSoup(html, "lxml")
-        league, match_date = MatchInfoParser._extract_league_and_date(soup)
+        league, match_date = MatchInfoParser._extract_league_and_date(
+            _find_div(html, MatchInfoParser.DATE_LEAGUE_TEXT_CLASS)
+        )
 
         assert league == "1. liga mužů"
-        assert match_date == "21.12.2025 11:00:00"
+        assert match_date == datetime(2025, 12, 21, 11, 0)
 
-    def test_extract_teams(self, example_html: str) -> None:
+    @pytest.mark.parametrize("date_text", ["21. 13. 2025 - 11:00", "21.12.2025 11:00", "zítra - 11:00"])
+    def test_extract_league_and_date_invalid_date(self, date_text: str) -> None:
+        """Test extraction when the date does not match the expected format."""
+        html = f"""
+        <div class="head match-detail blue br-btm">
+            <div class="col-12 text-center">
+                {date_text}, 1. liga mužů
+            </div>
+        </div>
+        """
+
+        with pytest.raises(MatchParsingError):
+            MatchInfoParser._extract_league_and_date(_find_div(html, MatchInfoParser.DATE_LEAGUE_TEXT_CLASS))
+
+    @pytest.mark.parametrize(
+        ("text", "expected_league"),
+        [
+            ("21. 12. 2025 - 11:00, 1. liga mužů", "1. liga mužů"),
+            ("\n    21.12.2025 - 11:00 ,  1. liga mužů  \n    Location\n", "1. liga mužů"),
+            ("21. 12. 2025 - 11:00, 1. liga mužů, Praha", "1. liga mužů"),
+        ],
+    )
+    def test_split_league_and_date(self, text: str, expected_league: str) -> None:
+        """Test splitting header text with varying whitespace and trailing content."""
+        league, match_date = MatchInfoParser._split_league_and_date(text)
+
+        assert league == expected_league
+        assert match_date == datetime(2025, 12, 21, 11, 0)
+
+    def test_extract_teams(self, example_tree: HtmlElement) -> None:
         """Test extraction of team names."""
 
-        soup = BeautifulSoup(example_html, "lxml")
-        home_team, away_team = MatchInfoParser._extract_teams(soup)
+        home_team, away_team = MatchInfoParser._extract_teams(MatchInfoParser._find_nodes(example_tree)[1])
 
         assert home_team == "UKVP Stepp Praha"
         assert away_team == "SK UP Olomouc"
@@ -114,19 +153,54 @@ class TestMatchInfoParser:
         </div>
         """
 
-        soup = BeautifulSoup(html, "lxml")
-        home_team, away_team = MatchInfoParser._extract_teams(soup)
+        home_team, away_team = MatchInfoParser._extract_teams(_find_div(html, MatchInfoParser.TEAM_HEADERS_CLASS))
 
         assert home_team == "Home Team"
         assert away_team == "Away Team"
 
-    def test_extract_teams_missing_whole_div(self) -> None:
-        """Test extraction when whole div is missing."""
-        html = "<html><body></body></html>"
+    def test_find_nodes(self, example_tree: HtmlElement) -> None:
+        """Test that the date/league, team headers and score divs are found."""
+        date_league_div, whole_div, score_div = MatchInfoParser._find_nodes(example_tree)
 
-        soup = BeautifulSoup(html, "lxml")
-        with pytest.raises(MatchParsingError):
-            MatchInfoParser._extract_teams(soup)
+        assert date_league_div.get("class") == MatchInfoParser.DATE_LEAGUE_TEXT_CLASS
+        assert whole_div.get("class") == MatchInfoParser.TEAM_HEADERS_CLASS
+        assert score_div.get("class") == MatchInfoParser.SCORE_DIV_CLASS
+
+    def test_collect_nodes_keeps_first_match(self) -> None:
+        """Test that the first div of each class is kept when a class repeats."""
+        root = lxml_html.document_fromstring(
+            """
+            <div class="whole" id="first"></div>
+            <div class="whole" id="second"></div>
+            """
+        )
+
+        nodes = MatchInfoParser._collect_nodes(root)
+
+        assert nodes[MatchInfoParser.TEAM_HEADERS_CLASS].get("id") == "first"
+        assert MatchInfoParser.SCORE_DIV_CLASS not in nodes
+
+    def test_find_nodes_missing_whole_div(self, example_text: str) -> None:
+        """Test node lookup when whole div is missing."""
+        root = lxml_html.document_fromstring(example_text.replace('class="whole"', 'class="part"'))
+        with pytest.raises(MatchParsingError, match="teams"):
+            MatchInfoParser._find_nodes(root)
+
+    def test_extract_teams_only_one_team_skips_section_headers(self) -> None:
+        """Test that section headers after a lone team header are not taken for the away team."""
+        html = """
+        <div class="whole">
+            <h3 class="tab-title grey">Home Team</h3>
+            <h3 class="tab-title grey">Průběh utkání</h3>
+            <h3 class="tab-title grey">1. čtvrtina</h3>
+            <h3 class="tab-title grey">Partneři</h3>
+        </div>
+        """
+
+        home_team, away_team = MatchInfoParser._extract_teams(_find_div(html, MatchInfoParser.TEAM_HEADERS_CLASS))
+
+        assert home_team == "Home Team"
+        assert away_team == ""
 
     def test_extract_teams_only_one_team(self) -> None:
         """Test extraction when only one team is present."""
@@ -140,17 +214,15 @@ class TestMatchInfoParser:
         </div>
         """
 
-        soup = BeautifulSoup(html, "lxml")
-        home_team, away_team = MatchInfoParser._extract_teams(soup)
+        home_team, away_team = MatchInfoParser._extract_teams(_find_div(html, MatchInfoParser.TEAM_HEADERS_CLASS))
 
         assert home_team == "Home Team"
         assert away_team == ""
 
-    def test_extract_score(self, example_html: str) -> None:
+    def test_extract_score(self, example_tree: HtmlElement) -> None:
         """Test extraction of score."""
 
-        soup = BeautifulSoup(example_html, "lxml")
-        home_score, away_score = MatchInfoParser._extract_score(soup)
+        home_score, away_score = MatchInfoParser._extract_score(MatchInfoParser._find_nodes(example_tree)[2])
 
         assert home_score == 33
         assert away_score == 5
@@ -165,8 +237,7 @@ class TestMatchInfoParser:
         </div>
         """
 
-        soup = BeautifulSoup(html, "lxml")
-        home_score, away_score = MatchInfoParser._extract_score(soup)
+        home_score, away_score = MatchInfoParser._extract_score(_find_div(html, MatchInfoParser.SCORE_DIV_CLASS))
 
         assert home_score == 15
         assert away_score == 12
@@ -180,8 +251,7 @@ class TestMatchInfoParser:
         </div>
         """
 
-        soup = BeautifulSoup(html, "lxml")
-        home_score, away_score = MatchInfoParser._extract_score(soup)
+        home_score, away_score = MatchInfoParser._extract_score(_find_div(html, MatchInfoParser.SCORE_DIV_CLASS))
 
         assert home_score == 10
         assert away_score == 8
@@ -195,40 +265,26 @@ class TestMatchInfoParser:
         </div>
         """
 
-        soup = BeautifulSoup(html, "lxml")
         with pytest.raises(MatchParsingError):
-            MatchInfoParser._extract_score(soup)
+            MatchInfoParser._extract_score(_find_div(html, MatchInfoParser.SCORE_DIV_CLASS))
 
-    def test_extract_score_missing_div(self) -> None:
-        """Test extraction when score div is missing."""
-        html = "<html><body></body></html>"
-
-        soup = BeautifulSoup(html, "lxml")
-        with pytest.raises(AttributeError):
-            MatchInfoParser._extract_score(soup)
-
-    def test_determine_winner_home_wins(self) -> None:
-        """Test winner determination when home team wins."""
-        assert MatchInfoParser._determine_winner(10, 5) == "H"
-        assert MatchInfoParser._determine_winner(1, 0) == "H"
-
-    def test_determine_winner_away_wins(self) -> None:
-        """Test winner determination when away team wins."""
-        assert MatchInfoParser._determine_winner(5, 10) == "A"
-        assert MatchInfoParser._determine_winner(0, 1) == "A"
+    def test_find_nodes_missing_score_div(self, example_text: str) -> None:
+        """Test node lookup when score div is missing."""
+        root = lxml_html.document_fromstring(example_text.replace(MatchInfoParser.SCORE_DIV_CLASS, "score"))
+        with pytest.raises(MatchParsingError, match="score"):
+            MatchInfoParser._find_nodes(root)
 
-    def test_determine_winner_draw(self) -> None:
-        """Test winner determination when it's a draw."""
-        assert MatchInfoParser._determine_winner(5, 5) == "D"
-        assert MatchInfoParser._determine_winner(0, 0) == "D"
-        assert MatchInfoParser._determine_winner(10, 10) == "D"
+    def test_find_nodes_empty_document(self) -> None:
+        """Test node lookup when no divs are present."""
+        root = lxml_html.document_fromstring("<html><body></body></html>")
+        with pytest.raises(MatchParsingError, match="league and date"):
+            MatchInfoParser._find_nodes(root)
 
-    def test_parse_match_home_wins(self, example_html: str) -> None:
+    def test_parse_match_home_wins(self, example_text: str) -> None:
         """Test parsing when home team wins."""
-        result = MatchInfoParser.parse_match(example_html, game_id=2425)
+        result = MatchInfoParser.parse_match(example_text, game_id=2425)
 
         assert result is not None
-        assert result.winner == "H"
         assert result.home_score > result.away_score
 
     def test_parse_match_away_wins(self) -> None:
@@ -262,7 +318,6 @@ class TestMatchInfoParser:
         result = MatchInfoParser.parse_match(html, game_id=123)
 
         assert result is not None
-        assert result.winner == "A"
         assert result.home_score < result.away_score
 
     def test_parse_match_draw(self) -> None:
@@ -296,12 +351,168 @@ class TestMatchInfoParser:
         result = MatchInfoParser.parse_match(html, game_id=123)
 
         assert result is not None
-        assert result.winner == "D"
         assert result.home_score == result.away_score
 
-    def test_parse_match_different_game_id(self, example_html: str) -> None:
+    def test_parse_match_zero_score(self) -> None:
+        """Test parsing keeps matches where one team scored zero."""
+        html = """
+        <div class="head match-detail blue br-btm">
+            <div class="col-12 text-center">
+                21. 12. 2025 - 11:00, 1. liga mužů
+            </div>
+            <div class="col-12 col-md-12 col-lg-12 col-xl-2 score mb-4">
+                5:0
+                <div class="state">Ukončené utkání</div>
+            </div>
+        </div>
+        <div class="whole">
+            <h3 class="tab-title grey">Home Team</h3>
+            <h3 class="tab-title grey">Away Team</h3>
+        </div>
+        """
+        result = MatchInfoParser.parse_match(html, game_id=123)
+
+        assert result is not None
+        assert result.home_score == 5
+        assert result.away_score == 0
+
+    def test_parse_fields_fast_matches_dom(self, example_text: str) -> None:
+        """Test that the regex fast path extracts the same fields as the DOM parser."""
+        fast_fields = MatchInfoParser._parse_fields_fast(example_text.encode())
+
+        assert fast_fields is not None
+        assert fast_fields == MatchInfoParser._parse_fields_dom(example_text.encode())
+
+    def test_parse_fields_fast_not_finished(self, example_text: str) -> None:
+        """Test that the fast path defers unfinished matches to the DOM parser."""
+        html = example_text.replace("Ukončené utkání", "Nezahájené utkání")
+
+        assert MatchInfoParser._parse_fields_fast(html.encode()) is None
+        assert MatchInfoParser.parse_match(html, game_id=2425) is None
+
+    def test_parse_match_not_finished_skips_parsing(self, example_text: str) -> None:
+        """Test that unfinished matches are rejected before either parser runs."""
+        html = example_text.replace("Ukončené utkání", "Nezahájené utkání")
+
+        with (
+            patch.object(MatchInfoParser, "_parse_fields_fast") as mock_fast,
+            patch.object(MatchInfoParser, "_parse_fields_dom") as mock_dom,
+        ):
+            assert MatchInfoParser.parse_match(html, game_id=2425) is None
+
+        mock_fast.assert_not_called()
+        mock_dom.assert_not_called()
+
+    def test_is_finished_missing_score_div(self) -> None:
+        """Test that a page without the finished text or a score div is a parsing error."""
+        with pytest.raises(MatchParsingError, match="score"):
+            MatchInfoParser._is_finished(b"<html><body><div class='whole'></div></body></html>")
+
+    def test_strip_preamble(self, example_text: str) -> None:
+        """Test that the page is cut at the first div the extractors read."""
+        stripped = MatchInfoParser._strip_preamble(example_text.encode())
+
+        assert stripped.startswith(b'<div class="head match-detail blue br-btm"')
+        assert b"<head>" not in stripped
+
+    def test_strip_preamble_without_markers(self) -> None:
+        """Test that pages without any of the expected divs are left whole."""
+        html = b"<html><body><div>Incomplete HTML</div></body></html>"
+
+        assert MatchInfoParser._strip_preamble(html) is html
+
+    def test_parse_match_fast_path_miss_falls_back(self) -> None:
+        """Test that markup the regexes cannot handle is parsed by the DOM parser."""
+        html = """
+        <div class="head match-detail blue br-btm">
+            <div class="col-12 text-center">
+                21. 12. 2025 - 11:00, 1. liga mužů
+            </div>
+            <div class="col-12 col-md-12 col-lg-12 col-xl-2 score mb-4">
+                7:6
+                <div class="state">Ukončené utkání</div>
+            </div>
+        </div>
+        <div class="whole">
+            <h3 class="tab-title grey"><span>Home Team</span></h3>
+            <h3 class="tab-title grey">Away Team</h3>
+        </div>
+        """
+        assert MatchInfoParser._parse_fields_fast(html.encode()) is None
+
+        result = MatchInfoParser.parse_match(html, game_id=123)
+
+        assert result is not None
+        assert result.home_team == "Home Team"
+        assert result.away_team == "Away Team"
+
+    def test_parse_match_bytes(self, example_text: str) -> None:
+        """Test that raw page bytes parse the same as decoded text."""
+        assert MatchInfoParser.parse_match(example_text.encode(), game_id=2425) == MatchInfoParser.parse_match(
+            example_text, game_id=2425
+        )
+
+    def test_parse_match_bytes_without_charset(self) -> None:
+        """Test that non-ASCII team names in bytes without a charset declaration decode as UTF-8."""
+        html = """
+        <div class="head match-detail blue br-btm">
+            <div class="col-12 text-center">
+                21. 12. 2025 - 11:00, 1. liga mužů
+            </div>
+            <div class="col-12 col-md-12 col-lg-12 col-xl-2 score mb-4">
+                7:6
+                <div class="state">Ukončené utkání</div>
+            </div>
+        </div>
+        <div class="whole">
+            <h3 class="tab-title grey"><span>Slávie Plzeň</span></h3>
+            <h3 class="tab-title grey">Kométa Brno</h3>
+        </div>
+        """
+        result = MatchInfoParser.parse_match(html.encode(), game_id=123)
+
+        assert result is not None
+        assert result.home_team == "Slávie Plzeň"
+        assert result.away_team == "Kométa Brno"
+        assert result.league == "1. liga mužů"
+
+    def test_get_html_parser_per_thread(self) -> None:
+        """Test that each thread reuses its own HTML parser."""
+        parser = MatchInfoParser._get_html_parser()
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            other_thread_parser = executor.submit(MatchInfoParser._get_html_parser).result()
+
+        assert MatchInfoParser._get_html_parser() is parser
+        assert other_thread_parser is not parser
+
+    def test_parse_match_invalid_utf8_falls_back(self) -> None:
+        """Test that invalid UTF-8 bytes in a page the DOM parser handles are replaced, not fatal."""
+        html = """
+        <div class="head match-detail blue br-btm">
+            <div class="col-12 text-center">
+                21. 12. 2025 - 11:00, 1. liga mužů
+            </div>
+            <div class="col-12 col-md-12 col-lg-12 col-xl-2 score mb-4">
+                7:6
+                <div class="state">Ukončené utkání</div>
+            </div>
+        </div>
+        <div class="whole">
+            <h3 class="tab-title grey"><span>Home INVALID Team</span></h3>
+            <h3 class="tab-title grey">Away Team</h3>
+        </div>
+        """.encode().replace(b"INVALID", b"\xff")
+
+        result = MatchInfoParser.parse_match(html, game_id=123)
+
+        assert result is not None
+        assert result.home_team == "Home \ufffd Team"
+        assert result.away_team == "Away Team"
+
+    def test_parse_match_different_game_id(self, example_text: str) -> None:
         """Test parsing with different game_id."""
-        result = MatchInfoParser.parse_match(example_html, game_id=9999)
+        result = MatchInfoParser.parse_match(example_text, game_id=9999)
 
         assert result is not None
         assert result.game_id == 9999
@@ -317,23 +528,28 @@ class TestMatchInfoParser:
     def test_parse_match_malformed_html(self) -> None:
         """Test parsing with malformed HTML."""
         html = "<div>Incomplete HTML"
-        # BeautifulSoup should handle this, but extraction might fail
+        # lxml recovers from this, but extraction should fail
         with pytest.raises(MatchParsingError):
             MatchInfoParser.parse_match(html, game_id=123)
 
-    def test_parse_match_date_validation(self, example_html: str) -> None:
+    def test_parse_match_empty_document(self) -> None:
+        """Test parsing an empty document raises MatchParsingError."""
+        with pytest.raises(MatchParsingError):
+            MatchInfoParser.parse_match("", game_id=123)
+
+    def test_parse_match_date_validation(self, example_text: str) -> None:
         """Test that match_date is properly converted to datetime."""
 
-        result = MatchInfoParser.parse_match(example_html, game_id=2425)
+        result = MatchInfoParser.parse_match(example_text, game_id=2425)
 
         assert result is not None
 
         assert isinstance(result.match_date, datetime)
         assert hasattr(result.match_date, "strftime")
 
-    def test_parse_match_all_fields_present(self, example_html: str) -> None:
+    def test_parse_match_all_fields_present(self, example_text: str) -> None:
         """Test that all required fields are extracted."""
-        result = MatchInfoParser.parse_match(example_html, game_id=2425)
+        result = MatchInfoParser.parse_match(example_text, game_id=2425)
 
         assert result is not None
         assert result.game_id is not None
@@ -343,4 +559,3 @@ class TestMatchInfoParser:
         assert result.league is not None
         assert isinstance(result.home_score, int)
         assert isinstance(result.away_score, int)
-        assert result.winner in ("H", "A", "D")
@@ -1,53 +1,59 @@
 from __future__ import annotations
 
-from pathlib import Path
-from unittest.mock import MagicMock, patch
+import asyncio
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
+import numpy as np
 import pandas as pd
 import pytest
 
-from cze_wp_scraper.models.match import MatchModel
+from cze_wp_scraper.models.row import MatchRow
+from cze_wp_scraper.scraper.cache import MatchPageCache
 from cze_wp_scraper.scraper.parser import MatchInfoParser
-from cze_wp_scraper.scraper.scraper import MatchScraper
+from cze_wp_scraper.scraper.scraper import MatchScraper, _parse_match_worker
 from cze_wp_scraper.utils.exceptions import MatchParsingError
 
-# Get the path to the example HTML fixture
-FIXTURES_DIR = Path(__file__).parent.parent.parent / "fixtures"
-EXAMPLE_HTML_PATH = FIXTURES_DIR / "example_match.html"
+if TYPE_CHECKING:
+    from pathlib import Path
 
 
 @pytest.fixture
-def example_html() -> str:
-    """Load example HTML from fixture file."""
-    return EXAMPLE_HTML_PATH.read_text(encoding="utf-8")
+def mock_httpx_client(example_html: bytes) -> MagicMock:
+    """Create a mocked HTTPMatchClient that returns example HTML, specced by name list as it is cheaper than a class."""
+    return MagicMock(
+        spec_set=["fetch_match", "fetch_match_async"],
+        fetch_match=MagicMock(return_value=example_html),
+        fetch_match_async=AsyncMock(return_value=example_html),
+    )
 
 
 @pytest.fixture
-def example_match_model() -> MatchModel:
-    """Create a sample MatchModel for testing."""
-    return MatchModel(
-        game_id=2425,
-        home_team="UKVP Stepp Praha",
-        away_team="SK UP Olomouc",
-        match_date="21.12.2025 11:00:00",
-        league="1. liga mužů - základní část",
-        home_score=33,
-        away_score=5,
-        winner="H",
-    )
+def recorded_runners():
+    """Record the asyncio.Runner instances the scraper creates, so tests can check they were closed."""
+    runner_class = asyncio.Runner
+    runners: list[asyncio.Runner] = []
 
+    def make_runner() -> asyncio.Runner:
+        runners.append(runner_class())
+        return runners[-1]
 
-@pytest.fixture
-def mock_httpx_client(example_html: str) -> MagicMock:
-    """Create a mocked httpx.Client that returns example HTML."""
-    mock_client = MagicMock(spec=httpx.Client, fetch_match=MagicMock(return_value=example_html))
-    mock_response = MagicMock(spec=httpx.Response)
-    mock_response.text = example_html
-    mock_response.status_code = 200
-    mock_response.raise_for_status = MagicMock()
-    mock_client.get.return_value = mock_response
-    return mock_client
+    with patch("cze_wp_scraper.scraper.scraper.asyncio.Runner", side_effect=make_runner):
+        yield runners
+
+
+@pytest.fixture(autouse=True)
+def thread_parse_pool():
+    """Parse in threads during tests so patched parser methods stay visible to the workers."""
+    with patch(
+        "cze_wp_scraper.scraper.scraper.ProcessPoolExecutor",
+        side_effect=lambda max_workers=None, **_: ThreadPoolExecutor(max_workers),
+    ) as mock_pool_class:
+        yield mock_pool_class
 
 
 class TestMatchScraper:
@@ -59,6 +65,7 @@ class TestMatchScraper:
         assert scraper.base_url is None
         assert scraper.timeout is None
         assert scraper.user_agent is None
+        assert scraper.concurrency == MatchScraper.MAX_CONCURRENCY
 
     def test_init_custom_values(self) -> None:
         """Test MatchScraper initialization with custom values."""
@@ -71,6 +78,29 @@ class TestMatchScraper:
         assert scraper.timeout == 60.0
         assert scraper.user_agent == "Custom Agent"
 
+    @pytest.mark.parametrize("concurrency", [0, -1])
+    def test_init_invalid_concurrency(self, concurrency: int) -> None:
+        """Test MatchScraper rejects a concurrency limit below 1."""
+        with pytest.raises(ValueError, match="concurrency must be at least 1"):
+            MatchScraper(concurrency=concurrency)
+
+    def test_init_cache(self, tmp_path: Path) -> None:
+        """Test MatchScraper creates a page cache when cache_dir is given."""
+        assert MatchScraper().cache is None
+
+        scraper = MatchScraper(cache_dir=tmp_path, refresh_cache=True)
+        assert scraper.cache is not None
+        assert scraper.cache.cache_dir == tmp_path
+        assert scraper.cache.refresh is True
+
+    def test_client_options_read_only(self) -> None:
+        """Test that client options cannot be changed after construction, since the client kwargs are built once."""
+        scraper = MatchScraper(timeout=45.0)
+
+        with pytest.raises(AttributeError):
+            scraper.timeout = 60.0  # type: ignore[misc]
+        assert scraper._get_client_kwargs() == {"timeout": 45.0}
+
     def test_get_client_kwargs_all_none(self) -> None:
         """Test _get_client_kwargs when all attributes are None."""
         scraper = MatchScraper()
@@ -97,13 +127,13 @@ class TestMatchScraper:
         kwargs = scraper._get_client_kwargs()
         assert kwargs == {"timeout": 45.0}
 
-    def test_scrape_single_match_success(self, mock_httpx_client: MagicMock, example_match_model: MatchModel) -> None:
+    def test_scrape_single_match_success(self, mock_httpx_client: MagicMock, example_match_model: MatchRow) -> None:
         """Test _scrape_single_match with successful fetch and parse."""
         with patch.object(MatchInfoParser, "parse_match", return_value=example_match_model):
             result = MatchScraper._scrape_single_match(mock_httpx_client, game_id=2425)
 
             assert result is not None
-            assert isinstance(result, MatchModel)
+            assert isinstance(result, MatchRow)
             assert result.game_id == 2425
             mock_httpx_client.fetch_match.assert_called_once_with(2425)
             MatchInfoParser.parse_match.assert_called_once()  # type: ignore[attr-defined]
@@ -126,6 +156,147 @@ class TestMatchScraper:
 
             assert result is None
 
+    @pytest.mark.asyncio
+    async def test_scrape_single_match_async_success(
+        self, mock_httpx_client: MagicMock, example_match_model: MatchRow
+    ) -> None:
+        """Test _scrape_single_match_async with successful fetch and parse."""
+        with patch.object(MatchInfoParser, "parse_match", return_value=example_match_model):
+            result = await MatchScraper._scrape_single_match_async(mock_httpx_client, game_id=2425)
+
+            assert result is example_match_model
+            mock_httpx_client.fetch_match_async.assert_awaited_once_with(2425)
+
+    @pytest.mark.asyncio
+    async def test_scrape_single_match_async_parse_error(self, mock_httpx_client: MagicMock) -> None:
+        """Test _scrape_single_match_async when parse fails."""
+        with patch.object(MatchInfoParser, "parse_match", side_effect=MatchParsingError("Parse error")):
+            result = await MatchScraper._scrape_single_match_async(mock_httpx_client, game_id=2425)
+
+            assert result is None
+
+    @pytest.mark.asyncio
+    async def test_scrape_single_match_async_cache_hit(
+        self, tmp_path: Path, mock_httpx_client: MagicMock, example_match_model: MatchRow
+    ) -> None:
+        """Test _scrape_single_match_async serves cached pages without fetching."""
+        cache = MatchPageCache(tmp_path)
+        cache.set(2425, b"<html>cached</html>")
+
+        with patch.object(MatchInfoParser, "parse_match", return_value=example_match_model) as mock_parse:
+            result = await MatchScraper._scrape_single_match_async(mock_httpx_client, 2425, cache)
+
+            assert result is example_match_model
+            mock_httpx_client.fetch_match_async.assert_not_awaited()
+            mock_parse.assert_called_once_with(b"<html>cached</html>", 2425)
+
+    @pytest.mark.asyncio
+    async def test_scrape_single_match_async_caches_finished_match(
+        self, tmp_path: Path, example_html: bytes, mock_httpx_client: MagicMock, example_match_model: MatchRow
+    ) -> None:
+        """Test _scrape_single_match_async stores fetched pages of finished matches."""
+        cache = MatchPageCache(tmp_path)
+
+        with patch.object(MatchInfoParser, "parse_match", return_value=example_match_model):
+            await MatchScraper._scrape_single_match_async(mock_httpx_client, 2425, cache)
+
+        assert cache.get(2425) == example_html
+
+    @pytest.mark.asyncio
+    async def test_scrape_single_match_async_skips_caching_unfinished_match(
+        self, tmp_path: Path, mock_httpx_client: MagicMock
+    ) -> None:
+        """Test _scrape_single_match_async does not cache pages of unfinished matches."""
+        cache = MatchPageCache(tmp_path)
+
+        with patch.object(MatchInfoParser, "parse_match", return_value=None):
+            result = await MatchScraper._scrape_single_match_async(mock_httpx_client, 2425, cache)
+
+        assert result is None
+        assert cache.get(2425) is None
+
+    @pytest.mark.asyncio
+    async def test_scrape_single_match_async_not_found(self, tmp_path: Path, mock_httpx_client: MagicMock) -> None:
+        """Test _scrape_single_match_async skips a 404 and records it as not found without marking it bad."""
+        cache = MatchPageCache(tmp_path)
+        not_found: set[int] = set()
+        request = httpx.Request("GET", "https://example.com")
+        mock_httpx_client.fetch_match_async.side_effect = httpx.HTTPStatusError(
+            "Not Found", request=request, response=httpx.Response(404, request=request)
+        )
+
+        result = await MatchScraper._scrape_single_match_async(mock_httpx_client, 2425, cache, not_found=not_found)
+
+        assert result is None
+        assert not_found == {2425}
+        assert not cache.is_bad(2425)
+
+    @pytest.mark.asyncio
+    async def test_scrape_single_match_async_server_error_skips(
+        self, tmp_path: Path, mock_httpx_client: MagicMock
+    ) -> None:
+        """Test _scrape_single_match_async skips non-404 HTTP errors without recording the game ID."""
+        cache = MatchPageCache(tmp_path)
+        not_found: set[int] = set()
+        request = httpx.Request("GET", "https://example.com")
+        mock_httpx_client.fetch_match_async.side_effect = httpx.HTTPStatusError(
+            "Server Error", request=request, response=httpx.Response(500, request=request)
+        )
+
+        result = await MatchScraper._scrape_single_match_async(mock_httpx_client, 2425, cache, not_found=not_found)
+
+        assert result is None
+        assert not cache.is_bad(2425)
+        assert not not_found
+
+    @pytest.mark.asyncio
+    async def test_scrape_single_match_async_transport_error_skips(
+        self, tmp_path: Path, mock_httpx_client: MagicMock
+    ) -> None:
+        """Test _scrape_single_match_async skips timeouts and connection errors without recording the game ID."""
+        cache = MatchPageCache(tmp_path)
+        not_found: set[int] = set()
+        mock_httpx_client.fetch_match_async.side_effect = httpx.ReadTimeout("Timed out")
+
+        result = await MatchScraper._scrape_single_match_async(mock_httpx_client, 2425, cache, not_found=not_found)
+
+        assert result is None
+        assert not cache.is_bad(2425)
+        assert not not_found
+
+    @pytest.mark.asyncio
+    async def test_scrape_single_match_async_parse_error_marks_bad(
+        self, tmp_path: Path, mock_httpx_client: MagicMock
+    ) -> None:
+        """Test _scrape_single_match_async marks game IDs that fail to parse as bad."""
+        cache = MatchPageCache(tmp_path)
+
+        with patch.object(MatchInfoParser, "parse_match", side_effect=MatchParsingError("Parse error")):
+            await MatchScraper._scrape_single_match_async(mock_httpx_client, 2425, cache)
+
+        assert cache.is_bad(2425)
+
+    @pytest.mark.asyncio
+    async def test_scrape_single_match_async_unfinished_not_marked_bad(
+        self, tmp_path: Path, mock_httpx_client: MagicMock
+    ) -> None:
+        """Test _scrape_single_match_async does not mark unfinished matches as bad."""
+        cache = MatchPageCache(tmp_path)
+
+        with patch.object(MatchInfoParser, "parse_match", return_value=None):
+            await MatchScraper._scrape_single_match_async(mock_httpx_client, 2425, cache)
+
+        assert not cache.is_bad(2425)
+
+    def test_parse_match_worker_is_picklable(self, example_html: bytes) -> None:
+        """Test that the parse worker can be sent to worker processes and parses pages."""
+        worker = pickle.loads(pickle.dumps(_parse_match_worker))
+
+        result = worker(example_html, 2425)
+
+        assert result is not None
+        assert pickle.loads(pickle.dumps(result)) == result
+
     def test_matches_to_dataframe_empty(self) -> None:
         """Test _matches_to_dataframe with empty list."""
         df = MatchScraper._matches_to_dataframe([])
@@ -144,7 +315,7 @@ class TestMatchScraper:
         ]
         assert list(df.columns) == expected_columns
 
-    def test_matches_to_dataframe_single(self, example_match_model: MatchModel) -> None:
+    def test_matches_to_dataframe_single(self, example_match_model: MatchRow) -> None:
         """Test _matches_to_dataframe with single match."""
         df = MatchScraper._matches_to_dataframe([example_match_model])
 
@@ -157,13 +328,13 @@ class TestMatchScraper:
         assert df.iloc[0]["away_score"] == 5
         assert df.iloc[0]["winner"] == "H"
 
-    def test_matches_to_dataframe_multiple(self, example_match_model: MatchModel) -> None:
+    def test_matches_to_dataframe_multiple(self, example_match_model: MatchRow) -> None:
         """Test _matches_to_dataframe with multiple matches."""
-        match2 = MatchModel(
+        match2 = MatchRow(
             game_id=2424,
             home_team="Team A",
             away_team="Team B",
-            match_date="20.12.2025 10:00:00",
+            match_date=datetime(2025, 12, 20, 10, 0),
             league="1. liga mužů",
             home_score=10,
             away_score=8,
@@ -176,7 +347,7 @@ class TestMatchScraper:
         assert list(df["game_id"]) == [2425, 2424]
         assert list(df["home_team"]) == ["UKVP Stepp Praha", "Team A"]
 
-    def test_matches_to_dataframe_column_order(self, example_match_model: MatchModel) -> None:
+    def test_matches_to_dataframe_column_order(self, example_match_model: MatchRow) -> None:
         """Test that _matches_to_dataframe returns columns in correct order."""
         df = MatchScraper._matches_to_dataframe([example_match_model])
 
@@ -192,16 +363,66 @@ class TestMatchScraper:
         ]
         assert list(df.columns) == expected_order
 
+    def test_determine_winners(self) -> None:
+        """Test vectorized winner determination for home wins, away wins and draws."""
+        winners = MatchScraper._determine_winners(np.array([10, 1, 5, 10, 0, 0]), np.array([5, 0, 10, 10, 1, 0]))
+
+        assert list(winners) == ["H", "H", "A", "D", "A", "D"]
+        assert list(winners.categories) == ["H", "A", "D"]
+
+    def test_matches_to_dataframe_computes_winner(self, example_match_model: MatchRow) -> None:
+        """Test that _matches_to_dataframe computes the winner from the scores."""
+        away_win = MatchRow(
+            game_id=2424,
+            home_team="Team A",
+            away_team="Team B",
+            match_date=datetime(2025, 12, 20, 10, 0),
+            league="1. liga mužů",
+            home_score=8,
+            away_score=10,
+        )
+        df = MatchScraper._matches_to_dataframe([example_match_model, away_win])
+
+        assert list(df["winner"]) == ["H", "A"]
+
+    def test_matches_to_dataframe_dtypes(self, example_match_model: MatchRow) -> None:
+        """Test that _matches_to_dataframe stores repeated strings as categoricals."""
+        df = MatchScraper._matches_to_dataframe([example_match_model, example_match_model])
+
+        for column in ("home_team", "away_team", "league", "winner"):
+            assert isinstance(df[column].dtype, pd.CategoricalDtype)
+        assert pd.api.types.is_datetime64_any_dtype(df["match_date"])
+        assert pd.api.types.is_integer_dtype(df["home_score"])
+        assert list(df["league"]) == ["1. liga mužů - základní část"] * 2
+
+    def test_matches_to_dataframe_follows_columns(self, example_match_model: MatchRow) -> None:
+        """Test that _matches_to_dataframe returns the columns in COLUMNS order."""
+        with patch.object(MatchScraper, "COLUMNS", ("winner", "game_id", "home_score")):
+            df = MatchScraper._matches_to_dataframe([example_match_model])
+
+        assert list(df.columns) == ["winner", "game_id", "home_score"]
+
+    def test_matches_to_dataframe_empty_dtypes(self, example_match_model: MatchRow) -> None:
+        """Test that an empty result has the same column dtypes as a non-empty one."""
+        empty = MatchScraper._matches_to_dataframe([])
+        df = MatchScraper._matches_to_dataframe([example_match_model])
+
+        for column in ("game_id", "match_date", "home_score", "away_score", "winner"):
+            assert empty[column].dtype == df[column].dtype
+        for column in ("home_team", "away_team", "league"):
+            assert isinstance(empty[column].dtype, pd.CategoricalDtype)
+            assert empty[column].cat.categories.dtype == df[column].cat.categories.dtype
+
     def test_scrape_matches_success(
-        self, example_html: str, example_match_model: MatchModel, mock_httpx_client: MagicMock
+        self, example_html: bytes, example_match_model: MatchRow, mock_httpx_client: MagicMock
     ) -> None:
         """Test scrape_matches with successful scraping."""
         with (
             patch("cze_wp_scraper.scraper.scraper.HTTPMatchClient") as mock_client_class,
             patch.object(MatchInfoParser, "parse_match", return_value=example_match_model),
         ):
-            mock_client_class.return_value.__enter__.return_value = mock_httpx_client
-            mock_httpx_client.fetch_match.return_value = example_html
+            mock_client_class.return_value.__aenter__.return_value = mock_httpx_client
+            mock_httpx_client.fetch_match_async.return_value = example_html
 
             scraper = MatchScraper()
             game_ids = [2425]
@@ -212,21 +433,21 @@ class TestMatchScraper:
             assert df.iloc[0]["game_id"] == 2425
 
     def test_scrape_matches_multiple_success(
-        self, example_html: str, example_match_model: MatchModel, mock_httpx_client: MagicMock
+        self, example_html: bytes, example_match_model: MatchRow, mock_httpx_client: MagicMock
     ) -> None:
         """Test scrape_matches with multiple successful matches."""
-        match2 = MatchModel(
+        match2 = MatchRow(
             game_id=2424,
             home_team="Team A",
             away_team="Team B",
-            match_date="20.12.2025 10:00:00",
+            match_date=datetime(2025, 12, 20, 10, 0),
             league="1. liga mužů",
             home_score=10,
             away_score=8,
             winner="H",
         )
 
-        def parse_side_effect(html: str, game_id: int) -> MatchModel:
+        def parse_side_effect(html: bytes, game_id: int) -> MatchRow:
             if game_id == 2425:
                 return example_match_model
             return match2
@@ -235,8 +456,8 @@ class TestMatchScraper:
             patch("cze_wp_scraper.scraper.scraper.HTTPMatchClient") as mock_client_class,
             patch.object(MatchInfoParser, "parse_match", side_effect=parse_side_effect),
         ):
-            mock_client_class.return_value.__enter__.return_value = mock_httpx_client
-            mock_httpx_client.fetch_match.return_value = example_html
+            mock_client_class.return_value.__aenter__.return_value = mock_httpx_client
+            mock_httpx_client.fetch_match_async.return_value = example_html
 
             scraper = MatchScraper()
             game_ids = [2425, 2424]
@@ -247,48 +468,43 @@ class TestMatchScraper:
             assert list(df["game_id"]) == [2425, 2424]
 
     def test_scrape_matches_partial_failure(
-        self, example_html: str, example_match_model: MatchModel, mock_httpx_client: MagicMock
+        self, example_html: bytes, example_match_model: MatchRow, mock_httpx_client: MagicMock
     ) -> None:
         """Test scrape_matches when some matches fail."""
 
-        def fetch_side_effect(game_id: int) -> str:
+        def fetch_side_effect(game_id: int) -> bytes:
             if game_id == 2425:
                 return example_html
-            raise httpx.HTTPStatusError("404 Not Found", request=MagicMock(), response=MagicMock())
+            raise httpx.HTTPStatusError("Server Error", request=MagicMock(), response=MagicMock())
 
         with (
             patch("cze_wp_scraper.scraper.scraper.HTTPMatchClient") as mock_client_class,
             patch.object(MatchInfoParser, "parse_match", return_value=example_match_model),
         ):
-            mock_client_class.return_value.__enter__.return_value = mock_httpx_client
-            mock_httpx_client.fetch_match.side_effect = fetch_side_effect
+            mock_client_class.return_value.__aenter__.return_value = mock_httpx_client
+            mock_httpx_client.fetch_match_async.side_effect = fetch_side_effect
 
             scraper = MatchScraper()
             game_ids = [2425, 9999]  # 9999 will fail
-            with pytest.raises(httpx.HTTPStatusError):
-                df = scraper.scrape_matches(game_ids)
+            df = scraper.scrape_matches(game_ids)
 
-                assert isinstance(df, pd.DataFrame)
-                assert len(df) == 1  # Only successful match
-                assert df.iloc[0]["game_id"] == 2425
+        assert isinstance(df, pd.DataFrame)
+        assert len(df) == 1  # Only successful match
+        assert df.iloc[0]["game_id"] == 2425
 
     def test_scrape_matches_all_fail(self, mock_httpx_client: MagicMock) -> None:
         """Test scrape_matches when all matches fail."""
-        mock_httpx_client.fetch_match.side_effect = httpx.HTTPStatusError(
-            "404 Not Found",
-            request=MagicMock(),
-            response=MagicMock(),
-        )
+        mock_httpx_client.fetch_match_async.side_effect = httpx.ConnectError("Connection refused")
 
-        with (
-            patch("cze_wp_scraper.scraper.scraper.HTTPMatchClient") as mock_client_class,
-            pytest.raises(httpx.HTTPStatusError),
-        ):
-            mock_client_class.return_value.__enter__.return_value = mock_httpx_client
+        with patch("cze_wp_scraper.scraper.scraper.HTTPMatchClient") as mock_client_class:
+            mock_client_class.return_value.__aenter__.return_value = mock_httpx_client
 
             scraper = MatchScraper()
             game_ids = [9999, 9998]
-            scraper.scrape_matches(game_ids)
+            df = scraper.scrape_matches(game_ids)
+
+        assert isinstance(df, pd.DataFrame)
+        assert df.empty
 
     def test_scrape_matches_empty_list(self) -> None:
         """Test scrape_matches with empty game_ids list."""
@@ -311,15 +527,15 @@ class TestMatchScraper:
             assert list(df.columns) == expected_columns
 
     def test_scrape_matches_custom_client_config(
-        self, example_html: str, example_match_model: MatchModel, mock_httpx_client: MagicMock
+        self, example_html: bytes, example_match_model: MatchRow, mock_httpx_client: MagicMock
     ) -> None:
         """Test scrape_matches passes custom client configuration."""
         with (
             patch("cze_wp_scraper.scraper.scraper.HTTPMatchClient") as mock_client_class,
             patch.object(MatchInfoParser, "parse_match", return_value=example_match_model),
         ):
-            mock_client_class.return_value.__enter__.return_value = mock_httpx_client
-            mock_httpx_client.fetch_match.return_value = example_html
+            mock_client_class.return_value.__aenter__.return_value = mock_httpx_client
+            mock_httpx_client.fetch_match_async.return_value = example_html
 
             scraper = MatchScraper(
                 base_url="https://custom.example.com",
@@ -336,15 +552,167 @@ class TestMatchScraper:
             assert call_kwargs["timeout"] == 60.0
             assert call_kwargs["user_agent"] == "Custom Agent"
 
-    def test_scrape_matches_parse_error_skipped(self, example_html: str, mock_httpx_client: MagicMock) -> None:
+    def test_scrape_matches_reuses_client_in_context(self, mock_httpx_client: MagicMock) -> None:
+        """Test that scrape_matches calls inside the context manager share one client, closed on exit."""
+        with patch("cze_wp_scraper.scraper.scraper.HTTPMatchClient") as mock_client_class:
+            mock_client_class.return_value.__aenter__.return_value = mock_httpx_client
+
+            with MatchScraper() as scraper:
+                first = scraper.scrape_matches([2425])
+                second = scraper.scrape_matches([2424])
+                mock_client_class.return_value.__aexit__.assert_not_called()
+
+            mock_client_class.assert_called_once()
+            mock_client_class.return_value.__aexit__.assert_awaited_once()
+            assert list(first["game_id"]) == [2425]
+            assert list(second["game_id"]) == [2424]
+            assert scraper._client is None
+            assert scraper._runner is None
+
+    def test_scrape_matches_reuses_parse_pool_in_context(
+        self, example_match_model: MatchRow, mock_httpx_client: MagicMock, thread_parse_pool: MagicMock
+    ) -> None:
+        """Test that scrape_matches calls inside the context manager share one parse process pool."""
+        with (
+            patch("cze_wp_scraper.scraper.scraper.HTTPMatchClient") as mock_client_class,
+            patch.object(MatchInfoParser, "parse_match", return_value=example_match_model),
+        ):
+            mock_client_class.return_value.__aenter__.return_value = mock_httpx_client
+
+            with MatchScraper(parse_workers=2) as scraper:
+                scraper.scrape_matches([2425])
+                scraper.scrape_matches([2424])
+
+        thread_parse_pool.assert_called_once()
+        assert scraper._executor is None
+
+    def test_scrape_matches_cancels_siblings_on_error_in_context(
+        self, example_html: bytes, mock_httpx_client: MagicMock
+    ) -> None:
+        """Test that a failing call inside the context manager leaves none of its fetches running into the next call."""
+        events: list[str] = []
+
+        async def fetch_side_effect(game_id: int) -> bytes:
+            if game_id == 1:
+                raise RuntimeError("unexpected failure")
+            events.append(f"start {game_id}")
+            await asyncio.sleep(0.01)
+            events.append(f"finish {game_id}")
+            return example_html
+
+        mock_httpx_client.fetch_match_async.side_effect = fetch_side_effect
+        with patch("cze_wp_scraper.scraper.scraper.HTTPMatchClient") as mock_client_class:
+            mock_client_class.return_value.__aenter__.return_value = mock_httpx_client
+
+            with MatchScraper() as scraper:
+                with pytest.raises(RuntimeError, match="unexpected failure"):
+                    scraper.scrape_matches([2, 1])
+                scraper.scrape_matches([2424])
+
+        assert events == ["start 2", "start 2424", "finish 2424"]
+
+    def test_context_closes_runner_when_client_fails_to_open(self, recorded_runners: list[asyncio.Runner]) -> None:
+        """Test that the event loop is closed if opening the client in __enter__ fails."""
+        with patch("cze_wp_scraper.scraper.scraper.HTTPMatchClient") as mock_client_class:
+            mock_client_class.return_value.__aenter__.side_effect = OSError("connection setup failed")
+
+            scraper = MatchScraper()
+            with pytest.raises(OSError, match="connection setup failed"), scraper:
+                pass
+
+        with pytest.raises(RuntimeError, match="closed"):
+            recorded_runners[0].get_loop()
+        assert scraper._runner is None
+
+    def test_context_closes_runner_when_client_fails_to_close(
+        self, mock_httpx_client: MagicMock, recorded_runners: list[asyncio.Runner]
+    ) -> None:
+        """Test that the event loop is closed even if closing the client in __exit__ fails."""
+        with patch("cze_wp_scraper.scraper.scraper.HTTPMatchClient") as mock_client_class:
+            mock_client_class.return_value.__aenter__.return_value = mock_httpx_client
+            mock_client_class.return_value.__aexit__.side_effect = OSError("close failed")
+
+            with pytest.raises(OSError, match="close failed"), MatchScraper() as scraper:
+                pass
+
+        with pytest.raises(RuntimeError, match="closed"):
+            recorded_runners[0].get_loop()
+        assert scraper._runner is None
+
+    def test_scrape_matches_without_context_opens_client_per_call(self, mock_httpx_client: MagicMock) -> None:
+        """Test that scrape_matches outside the context manager opens and closes a client per call."""
+        with patch("cze_wp_scraper.scraper.scraper.HTTPMatchClient") as mock_client_class:
+            mock_client_class.return_value.__aenter__.return_value = mock_httpx_client
+
+            scraper = MatchScraper()
+            scraper.scrape_matches([2425])
+            scraper.scrape_matches([2424])
+
+            assert mock_client_class.call_count == 2
+            assert mock_client_class.return_value.__aexit__.await_count == 2
+
+    def test_scrape_matches_parse_workers(
+        self, example_match_model: MatchRow, mock_httpx_client: MagicMock, thread_parse_pool: MagicMock
+    ) -> None:
+        """Test scrape_matches parses in a process pool sized by parse_workers."""
+        with (
+            patch("cze_wp_scraper.scraper.scraper.HTTPMatchClient") as mock_client_class,
+            patch.object(MatchInfoParser, "parse_match", return_value=example_match_model),
+        ):
+            mock_client_class.return_value.__aenter__.return_value = mock_httpx_client
+
+            MatchScraper(parse_workers=3).scrape_matches([2425])
+
+            thread_parse_pool.assert_called_once()
+            assert thread_parse_pool.call_args[1]["max_workers"] == 3
+            assert thread_parse_pool.call_args[1]["mp_context"].get_start_method() == "spawn"
+
+    def test_scrape_matches_parses_in_threads_by_default(
+        self, example_match_model: MatchRow, mock_httpx_client: MagicMock, thread_parse_pool: MagicMock
+    ) -> None:
+        """Test scrape_matches does not start worker processes unless parse_workers is set."""
+        with (
+            patch("cze_wp_scraper.scraper.scraper.HTTPMatchClient") as mock_client_class,
+            patch.object(MatchInfoParser, "parse_match", return_value=example_match_model),
+        ):
+            mock_client_class.return_value.__aenter__.return_value = mock_httpx_client
+
+            df = MatchScraper().scrape_matches([2425])
+
+        thread_parse_pool.assert_not_called()
+        assert list(df["game_id"]) == [2425]
+
+    def test_scrape_matches_concurrency_limit(self, example_html: bytes, mock_httpx_client: MagicMock) -> None:
+        """Test scrape_matches never has more than concurrency requests in flight."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fetch_match_async(game_id: int) -> bytes:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return example_html
+
+        mock_httpx_client.fetch_match_async.side_effect = fetch_match_async
+        with patch("cze_wp_scraper.scraper.scraper.HTTPMatchClient") as mock_client_class:
+            mock_client_class.return_value.__aenter__.return_value = mock_httpx_client
+
+            df = MatchScraper(concurrency=2).scrape_matches(list(range(1, 7)))
+
+        assert len(df) == 6
+        assert max_in_flight == 2
+
+    def test_scrape_matches_parse_error_skipped(self, example_html: bytes, mock_httpx_client: MagicMock) -> None:
         """Test that matches with parse errors are skipped."""
         with (
             patch("cze_wp_scraper.scraper.scraper.HTTPMatchClient") as mock_client_class,
             patch.object(MatchInfoParser, "parse_match", side_effect=ValueError("Parse error")),
             pytest.raises(ValueError),
         ):
-            mock_client_class.return_value.__enter__.return_value = mock_httpx_client
-            mock_httpx_client.fetch_match.return_value = example_html
+            mock_client_class.return_value.__aenter__.return_value = mock_httpx_client
+            mock_httpx_client.fetch_match_async.return_value = example_html
 
             scraper = MatchScraper()
             game_ids = [2425]
@@ -353,3 +721,83 @@ class TestMatchScraper:
 
             assert isinstance(df, pd.DataFrame)
             assert len(df) == 0  # Failed match is skipped
+
+    def test_scrape_matches_skips_known_bad(
+        self, tmp_path: Path, example_match_model: MatchRow, mock_httpx_client: MagicMock
+    ) -> None:
+        """Test scrape_matches skips known bad game IDs and persists newly found ones."""
+        cache = MatchPageCache(tmp_path)
+        cache.mark_bad(1)
+        cache.save_bad_ids()
+
+        def parse_side_effect(html: bytes, game_id: int) -> MatchRow:
+            if game_id == 2:
+                raise MatchParsingError("Parse error")
+            return example_match_model
+
+        with (
+            patch("cze_wp_scraper.scraper.scraper.HTTPMatchClient") as mock_client_class,
+            patch.object(MatchInfoParser, "parse_match", side_effect=parse_side_effect),
+        ):
+            mock_client_class.return_value.__aenter__.return_value = mock_httpx_client
+
+            df = MatchScraper(cache_dir=tmp_path).scrape_matches([1, 2, 3])
+
+            assert len(df) == 1
+            assert [call.args[0] for call in mock_httpx_client.fetch_match_async.await_args_list] == [2, 3]
+            assert MatchPageCache(tmp_path).is_bad(2)
+
+    def test_scrape_matches_not_found_marked_bad_only_below_latest(
+        self, tmp_path: Path, example_html: bytes, example_match_model: MatchRow, mock_httpx_client: MagicMock
+    ) -> None:
+        """Test that 404s are persisted as bad only below the highest game ID scraped, not past the newest match."""
+
+        async def fetch_side_effect(game_id: int) -> bytes:
+            if game_id in (2, 4, 5):
+                request = httpx.Request("GET", f"https://example.com/zapas/{game_id}")
+                raise httpx.HTTPStatusError("Not Found", request=request, response=httpx.Response(404, request=request))
+            return example_html
+
+        mock_httpx_client.fetch_match_async.side_effect = fetch_side_effect
+        with (
+            patch("cze_wp_scraper.scraper.scraper.HTTPMatchClient") as mock_client_class,
+            patch.object(MatchInfoParser, "parse_match", return_value=example_match_model),
+        ):
+            mock_client_class.return_value.__aenter__.return_value = mock_httpx_client
+
+            df = MatchScraper(cache_dir=tmp_path).scrape_matches([1, 2, 3, 4, 5])
+
+        assert len(df) == 2
+        cache = MatchPageCache(tmp_path)
+        assert cache.is_bad(2)
+        assert not cache.is_bad(4)
+        assert not cache.is_bad(5)
+
+    def test_scrape_matches_preserves_input_order(self, example_html: bytes, mock_httpx_client: MagicMock) -> None:
+        """Test that results follow the input order even when later fetches finish first."""
+
+        async def fetch_side_effect(game_id: int) -> bytes:
+            await asyncio.sleep(0.01 * (4 - game_id))
+            return example_html
+
+        def parse_side_effect(html: bytes, game_id: int) -> MatchRow:
+            return MatchRow(
+                game_id=game_id,
+                home_team="Team A",
+                away_team="Team B",
+                match_date=datetime(2025, 12, 20, 10, 0),
+                league="1. liga mužů",
+                home_score=10,
+                away_score=8,
+            )
+
+        mock_httpx_client.fetch_match_async.side_effect = fetch_side_effect
+        with (
+            patch("cze_wp_scraper.scraper.scraper.HTTPMatchClient") as mock_client_class,
+            patch.object(MatchInfoParser, "parse_match", side_effect=parse_side_effect),
+        ):
+            mock_client_class.return_value.__aenter__.return_value = mock_httpx_client
+
+            df = MatchScraper().scrape_matches([1, 2, 3])
+
+            assert list(df["game_id"]) == [1, 2, 3]
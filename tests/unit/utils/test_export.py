@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from cze_wp_scraper.utils.export import infer_output_format, write_csv, write_dataframe
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def matches_df() -> pd.DataFrame:
+    """Create a DataFrame shaped like the scraper output."""
+    df = pd.DataFrame(
+        {
+            "game_id": [2425, 2424],
+            "home_team": ["UKVP Stepp Praha", 'Team "A", Praha'],
+            "away_team": ["SK UP Olomouc", "Team B"],
+            "match_date": [datetime(2025, 12, 21, 11, 0), datetime(2025, 12, 20, 10, 0)],
+            "league": ["1. liga mužů - základní část", "1. liga mužů"],
+            "home_score": [33, 10],
+            "away_score": [5, 8],
+            "winner": ["H", "H"],
+        }
+    )
+    return df.astype({"home_team": "category", "league": "category", "winner": "category"})
+
+
+class TestWriteCsv:
+    """Test cases for write_csv."""
+
+    def test_write_csv(self, tmp_path: Path, matches_df: pd.DataFrame) -> None:
+        """Test that write_csv writes a header and one line per match."""
+        path = tmp_path / "matches.csv"
+
+        write_csv(matches_df, path)
+        lines = path.read_text(encoding="utf-8").splitlines()
+
+        assert len(lines) == 3
+        assert lines[0].replace('"', "") == ",".join(matches_df.columns)
+        assert lines[1] == (
+            '2425,"UKVP Stepp Praha","SK UP Olomouc",2025-12-21 11:00:00,"1. liga mužů - základní část",33,5,"H"'
+        )
+
+    def test_write_csv_multiple_batches(self, tmp_path: Path, matches_df: pd.DataFrame) -> None:
+        """Test that frames larger than one record batch get a single header and every row."""
+        path = tmp_path / "matches.csv"
+
+        with patch("cze_wp_scraper.utils.export.CSV_BATCH_SIZE", 1):
+            write_csv(matches_df, path)
+        lines = path.read_text(encoding="utf-8").splitlines()
+
+        assert len(lines) == 3
+        assert lines[2].startswith("2424,")
+
+    def test_round_trip(self, tmp_path: Path, matches_df: pd.DataFrame) -> None:
+        """Test that the written CSV reads back to the same values."""
+        path = tmp_path / "matches.csv"
+
+        write_csv(matches_df, path)
+        df = pd.read_csv(path, parse_dates=["match_date"])
+
+        assert list(df.columns) == list(matches_df.columns)
+        assert list(df["home_team"]) == ["UKVP Stepp Praha", 'Team "A", Praha']
+        assert list(df["match_date"]) == list(matches_df["match_date"])
+        assert list(df["home_score"]) == [33, 10]
+
+    def test_empty(self, tmp_path: Path) -> None:
+        """Test that an empty DataFrame writes only the header."""
+        path = tmp_path / "matches.csv"
+
+        write_csv(pd.DataFrame(columns=["game_id", "home_team"]), path)
+
+        assert path.read_text(encoding="utf-8").replace('"', "") == "game_id,home_team\n"
+
+
+class TestWriteDataframe:
+    """Test cases for write_dataframe and the binary formats."""
+
+    @pytest.mark.parametrize(
+        ("filename", "expected"),
+        [
+            ("matches.csv", "csv"),
+            ("matches.CSV", "csv"),
+            ("matches.parquet", "parquet"),
+            ("matches.feather", "feather"),
+            ("matches", "parquet"),
+        ],
+    )
+    def test_infer_output_format(self, filename: str, expected: str) -> None:
+        """Test that the output format is inferred from the file extension."""
+        assert infer_output_format(filename) == expected
+
+    @pytest.mark.parametrize("filename", ["matches.out", "matches.txt", "matches.xlsx"])
+    def test_infer_output_format_unknown_extension(self, filename: str) -> None:
+        """Test that an unrecognized file extension is rejected rather than written as Parquet."""
+        with pytest.raises(ValueError, match="Cannot infer output format"):
+            infer_output_format(filename)
+
+    def test_write_parquet_round_trip(self, tmp_path: Path, matches_df: pd.DataFrame) -> None:
+        """Test that Parquet output reads back unchanged, categoricals included."""
+        path = tmp_path / "matches.parquet"
+
+        write_dataframe(matches_df, path)
+
+        pd.testing.assert_frame_equal(pd.read_parquet(path), matches_df)
+
+    def test_write_feather_round_trip(self, tmp_path: Path, matches_df: pd.DataFrame) -> None:
+        """Test that Feather output reads back unchanged."""
+        path = tmp_path / "matches.feather"
+
+        write_dataframe(matches_df, path)
+
+        pd.testing.assert_frame_equal(pd.read_feather(path), matches_df)
+
+    def test_explicit_format_overrides_extension(self, tmp_path: Path, matches_df: pd.DataFrame) -> None:
+        """Test that an explicit format wins over the file extension."""
+        path = tmp_path / "matches.csv"
+
+        write_dataframe(matches_df, path, "parquet")
+
+        assert len(pd.read_parquet(path)) == len(matches_df)